@@ -0,0 +1,51 @@
+"""Counts the generator and Sign objects that word
+canonicalization leaves allocated, using tracemalloc.
+Every materialized BraidGenerator used to own a fresh
+Sign; interned generators and singleton signs make the
+count independent of the number of crossings.
+
+Run from the repository root:
+    python -m benchmarks.bench_alloc
+"""
+
+import random
+import tracemalloc
+from typing import List
+from braid.braid import Braid
+from braid.braid_generator import BraidGenerator
+from tests.generators import random_word
+
+WORDS = 20
+BOXES = 4
+WATCHED = ("braid_generator.py", "common.py")
+
+
+def main() -> None:
+    """Canonicalizes random words, materializes all of
+    their generators and reports what is still allocated
+    by the generator and sign modules"""
+    rng = random.Random(0)
+    words = [random_word(BOXES, rng) for _ in range(WORDS)]
+
+    tracemalloc.start()
+    kept: List[List[BraidGenerator]] = []
+    for w in words:
+        w.canonicalize()
+        kept.extend(list(o) for o in w if isinstance(o, Braid))
+    snapshot = tracemalloc.take_snapshot()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    crossings = sum(len(gens) for gens in kept)
+    blocks = sum(
+        stat.count
+        for stat in snapshot.statistics("filename")
+        if stat.traceback[0].filename.endswith(WATCHED)
+    )
+    print(f"crossings kept alive: {crossings}")
+    print(f"blocks allocated by generator/sign code: {blocks}")
+    print(f"peak traced memory: {peak / 1024:.0f} KiB")
+
+
+if __name__ == "__main__":
+    main()
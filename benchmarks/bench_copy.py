@@ -0,0 +1,34 @@
+"""Times making a mutant of a word: a copy followed by one
+braid edit. Copies share their braids, layers and objects
+until they change, so the time per mutant should barely grow
+with the number of boxes in the word.
+
+Run from the repository root:
+    python -m benchmarks.bench_copy
+"""
+
+import random
+from time import perf_counter
+from tests.generators import random_word
+
+SIZES = (4, 16, 64, 256)
+MUTANTS = 200
+BRAID_MUTATIONS = 15
+
+
+def main() -> None:
+    """Makes mutants of random words of several sizes and
+    prints the time per mutant"""
+    rng = random.Random(0)
+    for boxes in SIZES:
+        word = random_word(boxes, rng)
+        start = perf_counter()
+        for _ in range(MUTANTS):
+            mutant = word.copy()
+            mutant.fuzz_braid(rng.randrange(boxes + 1), rng.random, BRAID_MUTATIONS)
+        elapsed = perf_counter() - start
+        print(f"{boxes:4d} boxes: {elapsed / MUTANTS * 1e6:8.1f} us/mutant")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+"""Microbenchmark for the layer emit paths. Layer.delta
+prepends O(n^2) generators one at a time and LayerWrapper
+intends every emit onto the above braid, so both used to
+be quadratic in the braid length.
+
+Run from the repository root:
+    python -m benchmarks.bench_emit
+"""
+
+from time import perf_counter
+from braid.braid import Braid
+from category.morphism import Knit
+from category.object import Loop
+from common.common import Bed, Dir, Sign
+from layer.layer import Layer
+from layer.layer_wrapper import LayerWrapper
+
+
+def make_layer(width: int) -> Layer:
+    """Makes a layer whose box has width ins and outs
+
+    Args:
+        width (int): Number of ins and outs of the box
+
+    Returns:
+        Layer: Layer with one identity strand on each side
+    """
+    knit = Knit(
+        Bed(True),
+        Dir(True),
+        [Loop(i) for i in range(width)],
+        [Loop(i) for i in range(width)],
+    )
+    return Layer(1, knit, 1)
+
+
+def bench_delta(width: int) -> float:
+    """Times one delta, which emits width^2 generators
+    on each side
+
+    Args:
+        width (int): Box width
+
+    Returns:
+        float: Seconds per emitted generator
+    """
+    layer = make_layer(width)
+    start = perf_counter()
+    emit = layer.delta(Sign(True))
+    end = perf_counter()
+    return (end - start) / (len(emit.above()) + len(emit.below()))
+
+
+def bench_underline(ops: int) -> float:
+    """Times repeated underline conjugations whose
+    emits pile up on the neighbouring braids
+
+    Args:
+        ops (int): Number of underline conjugations
+
+    Returns:
+        float: Seconds per operation
+    """
+    layer = make_layer(4)
+    wrapper = LayerWrapper(Braid(layer.n_below()), layer, Braid(layer.n_above()))
+    start = perf_counter()
+    for k in range(ops):
+        wrapper.underline_conj(Dir(k % 2 == 0), True)
+    end = perf_counter()
+    return (end - start) / ops
+
+
+def main() -> None:
+    """Prints per-unit costs; they stay flat as the
+    sizes grow when the emit paths are linear"""
+    for width in [50, 200, 800]:
+        print(f"delta width={width}: {bench_delta(width) * 1e9:.0f} ns/generator")
+    for ops in [1000, 8000, 64000]:
+        print(f"underline_conj ops={ops}: {bench_underline(ops) * 1e6:.1f} us/op")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,43 @@
+"""Compares mutant generation with Braid.fuzz, one rewrite
+per step, against the batched sweeps of braid.fuzz. Both
+are reported in rewrite attempts per second: a step of
+Braid.fuzz, or a visited position of a sweep.
+
+Run from the repository root:
+    python -m benchmarks.bench_fuzz
+"""
+
+import random
+from time import perf_counter
+from tests.generators import random_braid_word
+from braid.fuzz import fuzz_many
+
+N = 10
+LETTERS = 200
+MUTANTS = 200
+STEPS = 400
+ROUNDS = 4
+
+
+def main() -> None:
+    """Fuzzes the same random braid both ways and prints
+    the throughput of each"""
+    random.seed(0)
+    braid = random_braid_word(N, LETTERS)
+
+    start = perf_counter()
+    for _ in range(MUTANTS):
+        mutant = braid.copy()
+        mutant.fuzz(random.random, STEPS)
+    single = MUTANTS * STEPS / (perf_counter() - start)
+
+    start = perf_counter()
+    mutants = fuzz_many(N, braid.word(), MUTANTS, ROUNDS, seed=0)
+    elapsed = perf_counter() - start
+    visited = sum(len(m) for m in mutants) * ROUNDS
+    print(f"Braid.fuzz:      {single:12.0f} attempts/s")
+    print(f"braid.fuzz sweep: {visited / elapsed:12.0f} attempts/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,37 @@
+"""Reports what importing layer.word costs, module by
+module, using python -X importtime. Canonicalization
+engines are loaded on first use, so none of them show up.
+
+Run from the repository root:
+    python -m benchmarks.bench_import
+"""
+
+import os
+import subprocess
+import sys
+
+SHOWN = 15
+
+
+def main() -> None:
+    """Imports layer.word in a fresh interpreter and prints
+    the slowest modules by cumulative import time"""
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(sys.path))
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import layer.word"],
+        capture_output=True,
+        check=True,
+        env=env,
+        text=True,
+    )
+    rows = []
+    for line in result.stderr.splitlines()[1:]:
+        _, total, name = line.split("|")
+        rows.append((int(total), name.rstrip()))
+    rows.sort(reverse=True)
+    for cumulative, name in rows[:SHOWN]:
+        print(f"{cumulative / 1000:8.1f} ms {name}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+"""Counts how often word canonicalization asks knits for
+their sizes and primary index. Each of these calls used to
+filter the slurped strands out into a fresh list; knits now
+keep the compacted strands until they're flipped, so none
+of them allocate.
+
+Run from the repository root:
+    python -m benchmarks.bench_knit
+"""
+
+import random
+from collections import Counter
+from time import perf_counter
+from typing import Callable
+from category.morphism import Knit
+from tests.generators import random_word
+
+WORDS = 50
+BOXES = 4
+COUNTED = ("n_ins", "n_outs", "primary_index", "ins", "outs")
+
+
+def counting(name: str, calls: Counter[str]) -> Callable[[Knit], object]:
+    """Wraps a Knit method so calls to it are counted"""
+    method = getattr(Knit, name)
+
+    def counted(knit: Knit) -> object:
+        calls[name] += 1
+        return method(knit)
+
+    return counted
+
+
+def main() -> None:
+    """Canonicalizes random words, timing them and counting
+    the knit accessor calls"""
+    rng = random.Random(0)
+    words = [random_word(BOXES, rng) for _ in range(WORDS)]
+    copies = [w.copy() for w in words]
+
+    start = perf_counter()
+    for w in words:
+        w.canonicalize()
+    elapsed = perf_counter() - start
+
+    calls: Counter[str] = Counter()
+    for name in COUNTED:
+        setattr(Knit, name, counting(name, calls))
+    for w in copies:
+        w.canonicalize()
+
+    saved = calls["n_ins"] + calls["n_outs"] + calls["primary_index"]
+    print(f"canonicalize: {elapsed / WORDS * 1000:.2f} ms/word")
+    for name in COUNTED:
+        print(f"Knit.{name}: {calls[name]} calls")
+    print(f"filtered lists no longer built: {saved}")
+
+
+if __name__ == "__main__":
+    main()
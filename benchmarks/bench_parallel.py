@@ -0,0 +1,38 @@
+"""Times canonicalizing large words made of independent
+components one at a time against canonicalizing their
+components in a process pool, one worker per core.
+
+Run from the repository root:
+    python -m benchmarks.bench_parallel
+"""
+
+import os
+import random
+from time import perf_counter
+from braid.canon import backend
+from layer.word import Word
+from tests.generators import wide_word
+
+WORDS = 4
+COMPONENTS = 8
+BOXES = 128
+
+
+def main() -> None:
+    """Canonicalizes copies of the same random words both
+    ways and prints the time taken"""
+    rng = random.Random(0)
+    words = [wide_word(COMPONENTS, BOXES, rng) for _ in range(WORDS)]
+    processes = os.cpu_count() or 1
+    for label, workers in (("serial", 0), (f"{processes} processes", processes)):
+        # the two ways give different braid words to the same
+        # canonical forms, so neither may reuse the other's
+        backend.cache.clear()
+        copies = [w.copy() for w in words]
+        start = perf_counter()
+        Word.canonicalize_many(copies, workers)
+        print(f"{label}: {perf_counter() - start:.3f} s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,45 @@
+"""Times probing which adjacent layers of a large word can
+swap. The old way copies the word before each attempt, since
+attempt_swap changes braids even when it fails; try_swap
+rolls a failed attempt back through the undo log instead.
+
+Run from the repository root:
+    python -m benchmarks.bench_probe
+"""
+
+import random
+from time import perf_counter
+from tests.generators import connected_word
+
+BOXES = 400
+PROBES = 2000
+
+
+def main() -> None:
+    """Probes the same random indices both ways and prints
+    the time per probe"""
+    rng = random.Random(0)
+    word = connected_word(BOXES, rng, letters=0)
+    indices = [rng.randrange(BOXES - 1) for _ in range(PROBES)]
+
+    copied = word.copy()
+    start = perf_counter()
+    for index in indices:
+        probe = copied.copy()
+        if probe.attempt_swap(index):
+            copied = probe
+    copying = (perf_counter() - start) / PROBES
+
+    logged = word.copy()
+    start = perf_counter()
+    for index in indices:
+        logged.try_swap(index)
+    rolling = (perf_counter() - start) / PROBES
+
+    assert logged == copied
+    print(f"copy then attempt_swap: {copying * 1e6:8.1f} us/probe")
+    print(f"try_swap:               {rolling * 1e6:8.1f} us/probe")
+
+
+if __name__ == "__main__":
+    main()
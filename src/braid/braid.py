@@ -4,17 +4,24 @@ and canonicalization of braids
 """
 
 from __future__ import annotations
-from typing import Callable, List, Sequence, Iterator, Tuple
+from array import array
+from typing import Callable, Dict, List, Optional, Sequence, Iterator, Tuple
+from braid import fuzz
 from braid.braid_generator import BraidGenerator
-from braid.sage import canonicalize_braid
+from braid.canon import backend, burau, handle
+from braid.canon.backend import canonical_word
 from category.object import PrimitiveObject
 from fig_gen.latex import Latex
 
 
-class Braid(Latex):
+class Braid(Latex):  # pylint: disable=too-many-public-methods
     """
     Represents a word in the braid
-    group using a list of generators.
+    group using a buffer of generators,
+    each stored as its 2-byte sage
+    encoding (see BraidGenerator.to_sage).
+    BraidGenerators are only made when
+    the braid is iterated over.
 
     Keeps track of how many strands
     it has and complains loudly if
@@ -23,7 +30,15 @@ class Braid(Latex):
 
     def __init__(self, n: int) -> None:
         self.__n = n
-        self.__gens: list[BraidGenerator] = []
+        self.__word = array("h")
+        # prepended generators, reversed, so that prepending
+        # is an append; folded into __word when read
+        self.__front = array("h")
+        # see permutation(); braid relations don't change it,
+        # so only adding generators touches the cache
+        self.__perm: Optional[List[int]] = None
+        # see fingerprint(); kept up to date the same way
+        self.__burau: Optional[burau.Matrix] = None
 
     def copy(self) -> Braid:
         """Returns a copy of this braid.
@@ -31,15 +46,66 @@ class Braid(Latex):
         Returns:
             Braid: Copy
         """
+        # pylint: disable=protected-access,unused-private-member
         b = Braid(self.n())
-        for gen in self:
-            b.append(gen)
+        b.__word = array("h", self.word())
+        if self.__perm is not None:
+            b.__perm = list(self.__perm)
+        if self.__burau is not None:
+            b.__burau = list(self.__burau)
         return b
 
+    def __getstate__(self) -> Dict[str, object]:
+        # the Burau matrix is evaluated at a point drawn per
+        # process, so it can't go to another process
+        state = dict(self.__dict__)
+        state["_Braid__burau"] = None
+        return state
+
     def reset_to(self, other: Braid) -> None:
         """Sets this braid's value to the given braid's value"""
+        # pylint: disable=protected-access
         self.__n = other.n()
-        self.__gens = list(other)
+        self.__word = array("h", other.word())
+        self.__front = array("h")
+        self.__perm = None if other.__perm is None else list(other.__perm)
+        self.__burau = None if other.__burau is None else list(other.__burau)
+
+    def word(self) -> array[int]:
+        """Getter. Don't mutate the result
+
+        Returns:
+            array[int]: Generators in sage encoding
+        """
+        if self.__front:
+            self.__front.reverse()
+            self.__front.extend(self.__word)
+            self.__word = self.__front
+            self.__front = array("h")
+        return self.__word
+
+    @staticmethod
+    def from_word(n: int, word: Sequence[int]) -> Braid:
+        """Makes a braid from generators in sage encoding
+
+        Args:
+            n (int): Number of strands
+            word (Sequence[int]): Generators, 1-indexed, negative
+            to represent inverses
+
+        Raises:
+            GeneratorOutOfBoundsException: when a generator
+                doesn't fit on n strands
+
+        Returns:
+            Braid: Braid with those generators
+        """
+        # pylint: disable=protected-access,unused-private-member
+        b = Braid(n)
+        b.__word = array("h", word)
+        if b.__word and not 0 < min(map(abs, b.__word)) <= max(map(abs, b.__word)) < n:
+            raise GeneratorOutOfBoundsException()
+        return b
 
     def flip_vertical(self) -> Braid:
         """Flips the braid vertically (reflection,
@@ -48,9 +114,9 @@ class Braid(Latex):
         Returns:
             Braid: Flipped braid
         """
+        # pylint: disable=protected-access,unused-private-member
         b = Braid(self.n())
-        for gen in reversed(list(self)):
-            b.append(gen)
+        b.__word = self.word()[::-1]
         return b
 
     @staticmethod
@@ -77,12 +143,84 @@ class Braid(Latex):
     def canon(self) -> Braid:
         """Returns the braid in canonical form
         that is equivalent to this braid"""
-        out = canonicalize_braid(self.n(), [g.to_sage() for g in self.__gens])
-        return Braid.from_sage(out, self.n())
+        # pylint: disable=protected-access,unused-private-member
+        b = Braid(self.n())
+        b.__word = array("h", canonical_word(self.n(), self.word()))
+        return b
 
     def set_canon(self) -> None:
         """Makes this braid the canon version of itself"""
-        self.__gens = list(self.canon())
+        # pylint: disable=protected-access
+        self.__word = self.canon().__word
+
+    @staticmethod
+    def canon_many(braids: Sequence[Braid], processes: int = 0) -> List[Braid]:
+        """Canonicalizes several braids with one backend call
+        per strand count
+
+        Args:
+            braids (Sequence[Braid]): Braids to canonicalize
+            processes (int, optional): When positive, the strand count
+            groups are split across this many worker processes. Defaults to 0.
+
+        Returns:
+            List[Braid]: Canonical braids, in input order
+        """
+        # pylint: disable=protected-access
+        groups: Dict[int, List[int]] = {}
+        for i, b in enumerate(braids):
+            groups.setdefault(b.n(), []).append(i)
+
+        out: List[Braid] = [Braid(b.n()) for b in braids]
+        if processes > 0:
+            jobs = [
+                (n, indices[chunk::processes])
+                for n, indices in groups.items()
+                for chunk in range(processes)
+                if indices[chunk::processes]
+            ]
+        else:
+            jobs = list(groups.items())
+        canons_by_job = Braid.__canon_jobs(braids, jobs, processes)
+        for (_, indices), canons in zip(jobs, canons_by_job):
+            for i, canon in zip(indices, canons):
+                out[i].__word = array("h", canon)
+        return out
+
+    @staticmethod
+    def __canon_jobs(
+        braids: Sequence[Braid], jobs: List[Tuple[int, List[int]]], processes: int
+    ) -> List[List[List[int]]]:
+        """Canonicalizes groups of braids with the same number
+        of strands, in a process pool when processes is positive
+
+        Args:
+            braids (Sequence[Braid]): All the braids
+            jobs (List[Tuple[int, List[int]]]): Strand count and
+            indices into braids of each group
+            processes (int): Worker processes, or 0 for none
+
+        Returns:
+            List[List[List[int]]]: Canonical words of each group
+        """
+        words = [[braids[i].word() for i in indices] for _, indices in jobs]
+        if processes <= 0:
+            return [backend.canonical_words(n, w) for (n, _), w in zip(jobs, words)]
+        return backend.canonical_words_pooled(
+            processes, [(n, w) for (n, _), w in zip(jobs, words)]
+        )
+
+    @staticmethod
+    def set_canon_many(braids: Sequence[Braid], processes: int = 0) -> None:
+        """Makes each braid the canon version of itself. See canon_many
+
+        Args:
+            braids (Sequence[Braid]): Braids to canonicalize in place
+            processes (int, optional): Worker processes. Defaults to 0.
+        """
+        # pylint: disable=protected-access,unused-private-member
+        for b, canon in zip(braids, Braid.canon_many(braids, processes)):
+            b.__word = canon.__word
 
     @staticmethod
     def from_sage(sage_out: List[Tuple[str, int]], n: int) -> Braid:
@@ -101,9 +239,83 @@ class Braid(Latex):
             i = int(name[1:]) if n > 2 else 0
             pos = power > 0
             for _ in range(abs(power)):
-                b.append(BraidGenerator(i, pos))
+                b.append(BraidGenerator.get(i, pos))
         return b
 
+    def permutation(self) -> List[int]:
+        """Computes where the strands end up. Cached until
+        generators are added; equivalent braids have the
+        same permutation
+
+        Returns:
+            List[int]: For each strand position at the top,
+            the position at the bottom the strand started at
+        """
+        return list(self.__permutation())
+
+    def is_pure(self) -> bool:
+        """Whether every strand ends where it starts, which
+        is necessary for the braid to be the identity
+
+        Returns:
+            bool: True if the permutation is the identity
+        """
+        return all(i == p for i, p in enumerate(self.__permutation()))
+
+    def fingerprint(self) -> int:
+        """Evaluates the Burau representation of the braid at a
+        random point modulo a large prime and hashes the matrix
+        to an int. The matrix is cached like permutation.
+        Equivalent braids have equal fingerprints, so unequal
+        fingerprints prove braids aren't equivalent and equal
+        ones make it very likely. The point is drawn once per
+        process, so only compare fingerprints from one process
+
+        Returns:
+            int: Digest of the Burau matrix
+        """
+        if self.__burau is None:
+            self.__burau = burau.of_word(self.n(), self.word())
+        return burau.digest(self.__burau)
+
+    def is_identity(self) -> bool:
+        """Whether the braid is trivial, decided by handle
+        reduction rather than canonicalization
+
+        Returns:
+            bool: True if the braid is equivalent to the empty braid
+        """
+        return self.is_pure() and handle.is_identity(self.n(), self.word())
+
+    def equivalent(self, other: Braid) -> bool:
+        """Whether the braids are equal in the braid group.
+        Only reduces handles when the strand permutations and
+        fingerprints can't tell the braids apart
+
+        Args:
+            other (Braid): Braid to compare to
+
+        Returns:
+            bool: True if the braids are equivalent
+        """
+        # pylint: disable=protected-access
+        if self.n() != other.n() or self.__permutation() != other.__permutation():
+            return False
+        if self.fingerprint() != other.fingerprint():
+            return False
+        word = list(self.word())
+        word.extend(-g for g in reversed(other.word()))
+        return handle.is_identity(self.n(), word)
+
+    def __permutation(self) -> List[int]:
+        if self.__perm is None:
+            perm = list(range(self.n()))
+            for g in self.word():
+                i = abs(g) - 1
+                perm[i], perm[i + 1] = perm[i + 1], perm[i]
+            self.__perm = perm
+        return self.__perm
+
     def n(self) -> int:
         """Simple get function
 
@@ -138,7 +350,12 @@ class Braid(Latex):
         """
         self.__check_gen_valid(after)
 
-        self.__gens.append(after)
+        self.__word.append(after.to_sage())
+        if self.__perm is not None:
+            i = after.i()
+            self.__perm[i], self.__perm[i + 1] = self.__perm[i + 1], self.__perm[i]
+        if self.__burau is not None:
+            burau.multiply_right(self.__burau, self.n(), after.to_sage())
 
     def prepend(self, before: BraidGenerator) -> None:
         """Puts a generator at the start of a word
@@ -152,7 +369,10 @@ class Braid(Latex):
         """
         self.__check_gen_valid(before)
 
-        self.__gens = [before] + self.__gens
+        self.__front.append(before.to_sage())
+        self.__perm = None
+        if self.__burau is not None:
+            burau.multiply_left(self.__burau, self.n(), before.to_sage())
 
     def __check_compatible(self, other: Braid) -> None:
         """Raises an exception when the braids can't
@@ -176,7 +396,9 @@ class Braid(Latex):
             after (Braid): Braid to add after self
         """
         self.__check_compatible(after)
-        self.__gens.extend(list(after))
+        self.__word.extend(after.word())
+        self.__perm = None
+        self.__burau = None
 
     def intend(self, before: Braid) -> None:
         """Adds the supplied braid's generators
@@ -186,8 +408,60 @@ class Braid(Latex):
             before (Braid): Braid to add before self
         """
         self.__check_compatible(before)
-        # TODO: this is why it'd be nice to use linked lists
-        self.__gens = list(before) + self.__gens
+        self.__front.extend(before.word()[::-1])
+        self.__perm = None
+        self.__burau = None
+
+    def drop_last(self, k: int) -> None:
+        """Removes the last k generators, undoing an extend.
+        Cached permutations and fingerprints are kept up to
+        date, so this is O(k) rather than O(len)
+
+        Args:
+            k (int): Number of generators to remove
+        """
+        if k <= 0:
+            return
+        if len(self.__word) < k:
+            self.word()  # fold in prepended generators
+        for g in self.__word[-k:][::-1]:
+            if self.__perm is not None:
+                i = abs(g) - 1
+                self.__perm[i], self.__perm[i + 1] = self.__perm[i + 1], self.__perm[i]
+            if self.__burau is not None:
+                burau.multiply_right(self.__burau, self.n(), -g)
+        del self.__word[-k:]
+
+    def drop_first(self, k: int) -> None:
+        """Removes the first k generators, undoing an intend.
+        The cached fingerprint is kept up to date in O(k).
+        The removed generators relabel where strands start,
+        so the cached permutation takes O(n + k), still
+        rather than O(len)
+
+        Args:
+            k (int): Number of generators to remove
+        """
+        if k <= 0:
+            return
+        if len(self.__front) < k:
+            self.word()  # fold in prepended generators
+            self.__front = self.__word[::-1]
+            self.__word = array("h")
+        removed = self.__front[-k:]
+        del self.__front[-k:]
+        if self.__perm is not None:
+            # where the removed generators alone take each
+            # position they touch, bottom up
+            moved: Dict[int, int] = {}
+            for g in reversed(removed):
+                i = abs(g) - 1
+                moved[i], moved[i + 1] = moved.get(i + 1, i + 1), moved.get(i, i)
+            start = {p: i for i, p in moved.items()}
+            self.__perm = [start.get(p, p) for p in self.__perm]
+        if self.__burau is not None:
+            for g in reversed(removed):
+                burau.multiply_left(self.__burau, self.n(), -g)
 
     def subbraid(self, keep: set[int]) -> Braid:
         """Computes and returns a subbraid of
@@ -202,24 +476,29 @@ class Braid(Latex):
             Braid: Subbraid on len(keep)
             strands
         """
-        b = Braid(len(keep))
-        for g in self:
-            i = g.i()
-            if i in keep:
-                if i + 1 in keep:
-                    j = 0
-                    for x in keep:
-                        if x < i:
-                            j += 1
-                    b.append(BraidGenerator(j, g.pos()))
+        # pylint: disable=protected-access
+        n = self.n()
+        out = Braid(len(keep))
+        # kept[p] says whether the strand at position p is kept;
+        # rank[p] counts the kept strands left of position p.
+        # A crossing only moves a strand to the next position,
+        # so at most rank[i + 1] changes
+        kept = [i in keep for i in range(n)]
+        rank = [0] * n
+        for p in range(1, n):
+            rank[p] = rank[p - 1] + kept[p - 1]
+        for g in self.word():
+            i = abs(g) - 1
+            if kept[i]:
+                if kept[i + 1]:
+                    out.__word.append(rank[i] + 1 if g > 0 else -rank[i] - 1)
                 else:
-                    keep.remove(i)
-                    keep.add(i + 1)
-            else:
-                if i + 1 in keep:
-                    keep.remove(i + 1)
-                    keep.add(i)
-        return b
+                    kept[i], kept[i + 1] = False, True
+                    rank[i + 1] = rank[i]
+            elif kept[i + 1]:
+                kept[i], kept[i + 1] = True, False
+                rank[i + 1] = rank[i] + 1
+        return out
 
     def fuzz(self, rng: Callable[[], float], steps: int) -> None:
         """Fuzzes the braid word by applying a series
@@ -230,22 +509,43 @@ class Braid(Latex):
             rng (Callable[[], float]): Random number generator
             steps (int): Number of rewrite rules to apply
         """
+        self.word()  # fold in prepended generators
         for _ in range(steps):
-            if not self.__gens:
+            if not self.__word:
                 # uncancel a few times
                 for _ in range(self.n()):
-                    i = int(rng() * (len(self.__gens) + 1))
-                    j = int(rng() * (self.n() - 1))
+                    i = int(rng() * (len(self.__word) + 1))
+                    j = int(rng() * (self.n() - 1)) + 1
                     first_inv = rng() < 0.5
-                    self.__gens.insert(i, BraidGenerator(j, first_inv))
-                    self.__gens.insert(i, BraidGenerator(j, not first_inv))
+                    self.__word.insert(i, j if first_inv else -j)
+                    self.__word.insert(i, -j if first_inv else j)
             else:
                 # Select a random index in the list of generators
-                i = int(rng() * len(self.__gens))
+                i = int(rng() * len(self.__word))
 
                 # Apply a random braid relation at this index
                 self.__fuzz_index(i, rng)
 
+    def fuzz_many(self, count: int, rounds: int, seed: int) -> List[Braid]:
+        """Makes several fuzzed copies of this braid with the
+        batched fuzzer (see braid.fuzz). Deterministic per seed
+
+        Args:
+            count (int): Number of mutants
+            rounds (int): Number of sweeps over each mutant
+            seed (int): Seed for the random choices
+
+        Returns:
+            List[Braid]: Mutants, all equivalent to this braid
+        """
+        # pylint: disable=protected-access,unused-private-member
+        mutants = []
+        for word in fuzz.fuzz_many(self.n(), self.word(), count, rounds, seed):
+            b = Braid(self.n())
+            b.__word = word
+            mutants.append(b)
+        return mutants
+
     def __fuzz_index(self, i: int, rng: Callable[[], float]) -> None:
         """Attempts to apply a braid word equivalence at this
         index. If none work, has a chance to uncancel a pair
@@ -255,42 +555,38 @@ class Braid(Latex):
             i (int): 0-index in the braid word's length
             rng (Callable[[], float]): Random number generator
         """
-        if not 0 < i < len(self.__gens) - 1:
+        if not 0 < i < len(self.__word) - 1:
             return
-        g1 = self.__gens[i - 1]
-        g2 = self.__gens[i]
-        g3 = self.__gens[i + 1]
+        g1 = self.__word[i - 1]
+        g2 = self.__word[i]
+        g3 = self.__word[i + 1]
 
         # Yang-baxter?
-        if (
-            g1.i() == g3.i()
-            and abs(g1.i() - g2.i()) == 1
-            and g1.pos() == g2.pos() == g3.pos()
-        ):
-            self.__gens[i - 1 : i + 2] = [g2, g1, g2]
+        if g1 == g3 and abs(abs(g1) - abs(g2)) == 1 and (g1 > 0) == (g2 > 0):
+            self.__word[i - 1 : i + 2] = array("h", [g2, g1, g2])
         # Cancel?
-        elif g1.i() == g2.i() and g1.pos() != g2.pos():
+        elif g1 == -g2:
             # Remove both generators
-            del self.__gens[i - 1 : i + 1]
+            del self.__word[i - 1 : i + 1]
         # Swap?
-        elif abs(g1.i() - g2.i()) >= 2:
-            self.__gens[i - 1 : i + 1] = [g2, g1]
+        elif abs(abs(g1) - abs(g2)) >= 2:
+            self.__word[i - 1 : i + 1] = array("h", [g2, g1])
         else:
             # Uncancel?
             if rng() < 0.3:
-                j = int(rng() * (self.n() - 1))
+                j = int(rng() * (self.n() - 1)) + 1
                 first_inv = rng() < 0.5
-                self.__gens.insert(i, BraidGenerator(j, first_inv))
-                self.__gens.insert(i, BraidGenerator(j, not first_inv))
+                self.__word.insert(i, j if first_inv else -j)
+                self.__word.insert(i, -j if first_inv else j)
 
     def __iter__(self) -> Iterator[BraidGenerator]:
-        return iter(self.__gens)
+        return map(BraidGenerator.from_sage, self.word())
 
     def __len__(self) -> int:
-        return len(self.__gens)
+        return len(self.__front) + len(self.__word)
 
     def __repr__(self) -> str:
-        return f"Braid(n={self.__n}, {self.__gens})"
+        return f"Braid(n={self.__n}, {list(self)})"
 
     def __str__(self) -> str:
         return "".join([str(g) for g in self])
@@ -298,7 +594,7 @@ class Braid(Latex):
     def __eq__(self, other: object) -> bool:
         if not isinstance(other, Braid):
             return False
-        return self.n() == other.n() and list(iter(self)) == list(iter(other))
+        return self.n() == other.n() and self.word() == other.word()
 
     def to_latex(self, x: int, y: int, context: Sequence[PrimitiveObject]) -> str:
         str_latex = ""
@@ -310,7 +606,7 @@ class Braid(Latex):
             y += g.latex_height()
             context = g.context_out(context)
 
-        if self.__gens == []:
+        if len(self) == 0:
             for i, o in enumerate(context):
                 (r, gr, b) = o.color()
                 str_latex += (
@@ -325,10 +621,7 @@ class Braid(Latex):
     def context_out(
         self, context: Sequence[PrimitiveObject]
     ) -> Sequence[PrimitiveObject]:
-        for g in self:
-            context = g.context_out(context)
-
-        return context
+        return [context[p] for p in self.__permutation()]
 
 
 class StrandMismatchException(Exception):
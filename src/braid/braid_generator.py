@@ -4,7 +4,7 @@ algorithm going on here.
 """
 
 from __future__ import annotations
-from typing import Sequence
+from typing import Dict, Sequence, Tuple
 from category.object import PrimitiveObject
 from common.common import Sign
 from fig_gen.latex import Latex
@@ -16,12 +16,35 @@ class BraidGenerator(Latex):
     braid words. i represents the
     0-index of the left strand;
     sign is pos when the left strand
-    goes over the right
+    goes over the right. Immutable; use
+    get to share one instance per generator
     """
 
+    __slots__ = ("__i", "__sign", "__hash")
+    __interned: Dict[Tuple[int, bool], BraidGenerator] = {}
+
     def __init__(self, i: int, sign: bool) -> None:
         self.__i = i
         self.__sign = Sign(sign)
+        self.__hash = hash((i, self.__sign.pos()))
+
+    @staticmethod
+    def get(i: int, pos: bool) -> BraidGenerator:
+        """Returns the shared instance of a generator
+
+        Args:
+            i (int): left index of the swapped strands
+            pos (bool): True if left over right else False
+
+        Returns:
+            BraidGenerator: interned generator
+        """
+        key = (i, pos)
+        g = BraidGenerator.__interned.get(key)
+        if g is None:
+            g = BraidGenerator(i, pos)
+            BraidGenerator.__interned[key] = g
+        return g
 
     def i(self) -> int:
         """Getter
@@ -44,6 +67,19 @@ class BraidGenerator(Latex):
         this generator"""
         return (self.__i + 1) * (1 if self.__sign.pos() else -1)
 
+    @staticmethod
+    def from_sage(g: int) -> BraidGenerator:
+        """Inverse of to_sage
+
+        Args:
+            g (int): 1-indexed generator, negative
+            for an inverse
+
+        Returns:
+            BraidGenerator: generator represented by g
+        """
+        return BraidGenerator.get(abs(g) - 1, g > 0)
+
     @staticmethod
     def from_char(c: str) -> BraidGenerator:
         """Converts an alphabetic character to
@@ -65,7 +101,7 @@ class BraidGenerator(Latex):
         if not c.isalpha():
             raise ValueError()
         i = ord(c.lower()) - ord("a")
-        return BraidGenerator(i, c.islower())
+        return BraidGenerator.get(i, c.islower())
 
     def __repr__(self) -> str:
         return str((self.i(), self.__sign.pos()))
@@ -74,10 +110,15 @@ class BraidGenerator(Latex):
         return chr(ord("a" if self.pos() else "A") + self.i())
 
     def __eq__(self, other: object) -> bool:
+        if self is other:
+            return True
         if not isinstance(other, BraidGenerator):
             return False
         return self.i() == other.i() and self.pos() == other.pos()
 
+    def __hash__(self) -> int:
+        return self.__hash
+
     def to_latex(self, x: int, y: int, context: Sequence[PrimitiveObject]) -> str:
         str_latex = ""
 
@@ -0,0 +1,223 @@
+"""Chooses which engine canonicalizes braid words. Engines
+are registered by module path and imported the first time
+they're used; the native Garside engine is the default.
+Canonical words are cached; set BRAID_CANON_CACHE_FILE to
+keep the cache on disk between runs. The file records which
+engine filled it and is ignored under any other engine"""
+
+import atexit
+import importlib
+import os
+from typing import Dict, List, Optional, Protocol, Sequence, Tuple, cast
+from braid.canon.cache import CanonCache
+from braid.canon.reduce import FreeReducer
+
+
+class Engine(Protocol):
+    """What a module has to define to be registered as a backend"""
+
+    def canonicalize_braid(self, n: int, braid: List[int]) -> List[Tuple[str, int]]:
+        """See braid.canon.garside.canonicalize_braid"""
+
+    def canonical_words(self, n: int, braids: List[List[int]]) -> List[List[int]]:
+        """See braid.canon.garside.canonical_words"""
+
+
+_registry: Dict[str, str] = {
+    "native": "braid.canon.garside",
+    "sage": "braid.sage",
+}
+
+
+class _Selection:  # pylint: disable=too-few-public-methods
+    """Holds the name of the selected engine"""
+
+    def __init__(self) -> None:
+        self.name = "native"
+
+
+_selection = _Selection()
+
+cache = CanonCache()
+
+reducer = FreeReducer()
+
+
+def register_backend(name: str, module: str) -> None:
+    """Makes an engine selectable by name. The module is
+    only imported the first time the engine canonicalizes
+    something
+
+    Args:
+        name (str): Name to select the engine by
+        module (str): Dotted path of a module defining
+        canonicalize_braid and canonical_words (see Engine)
+    """
+    _registry[name] = module
+
+
+def backends() -> Tuple[str, ...]:
+    """Getter
+
+    Returns:
+        Tuple[str, ...]: Names of the registered engines
+    """
+    return tuple(_registry)
+
+
+def set_backend(name: str) -> None:
+    """Selects the canonicalization engine
+
+    Args:
+        name (str): One of backends()
+
+    Raises:
+        ValueError: when the name isn't a known backend
+    """
+    if name not in _registry:
+        raise ValueError(f"Unknown braid canonicalization backend {name}")
+    if name != _selection.name:
+        cache.clear()
+    _selection.name = name
+
+
+def get_backend() -> str:
+    """Getter
+
+    Returns:
+        str: Name of the selected canonicalization engine
+    """
+    return _selection.name
+
+
+def _engine() -> Engine:
+    return cast(Engine, importlib.import_module(_registry[_selection.name]))
+
+
+def canonicalize_braid(n: int, braid: List[int]) -> List[Tuple[str, int]]:
+    """Canonicalizes a braid word with the selected engine
+
+    Args:
+        n (int): Number of strands
+        braid (List[int]): List of generators, 1-indexed, negative to represent inverses
+
+    Returns:
+        List[Tuple[str, int]]: List of syllables in the braid word
+    """
+    return _engine().canonicalize_braid(n, reducer.reduce(n, braid))
+
+
+def canonical_word(n: int, braid: Sequence[int]) -> List[int]:
+    """Canonicalizes a braid word with the selected engine,
+    without going through syllable strings. Goes through
+    the cache first
+
+    Args:
+        n (int): Number of strands
+        braid (Sequence[int]): Generators, 1-indexed, negative to represent inverses
+
+    Returns:
+        List[int]: Canonical list of generators, 1-indexed, negative to represent inverses
+    """
+    return canonical_words(n, [braid])[0]
+
+
+def canonical_words(n: int, braids: Sequence[Sequence[int]]) -> List[List[int]]:
+    """Canonicalizes several braid words on the same number of
+    strands with one call into the selected engine. Cached words
+    aren't sent to the engine; the others are freely reduced
+    first (see reducer)
+
+    Args:
+        n (int): Number of strands
+        braids (Sequence[Sequence[int]]): Braid words, generators 1-indexed,
+        negative to represent inverses
+
+    Returns:
+        List[List[int]]: Canonical braid words, in input order
+    """
+    out: List[Optional[List[int]]] = [cache.get(n, braid) for braid in braids]
+    misses = [i for i, word in enumerate(out) if word is None]
+    if misses:
+        todo = [reducer.reduce(n, braids[i]) for i in misses]
+        words = _engine().canonical_words(n, todo)
+        for i, word in zip(misses, words):
+            cache.put(n, braids[i], word)
+            out[i] = word
+    return [word if word is not None else [] for word in out]
+
+
+def canonical_words_with(
+    name: str, n: int, braids: Sequence[Sequence[int]]
+) -> List[List[int]]:
+    """Selects a backend, then canonicalizes several braid
+    words with it. Used by worker processes, which don't
+    inherit the parent's selection
+
+    Args:
+        name (str): One of backends()
+        n (int): Number of strands
+        braids (Sequence[Sequence[int]]): Braid words, generators 1-indexed,
+        negative to represent inverses
+
+    Returns:
+        List[List[int]]: Canonical braid words, in input order
+    """
+    set_backend(name)
+    return canonical_words(n, braids)
+
+
+def canonical_words_pooled(
+    processes: int, jobs: Sequence[Tuple[int, Sequence[Sequence[int]]]]
+) -> List[List[List[int]]]:
+    """Canonicalizes groups of braid words in a process pool,
+    one task per group. Words cached in this process aren't
+    sent, and the words the workers canonicalize are cached
+    here, like canonical_words
+
+    Args:
+        processes (int): Worker processes
+        jobs (Sequence[Tuple[int, Sequence[Sequence[int]]]]): Number
+        of strands and braid words of each group
+
+    Returns:
+        List[List[List[int]]]: Canonical braid words of each
+        group, in input order
+    """
+    # pylint: disable=import-outside-toplevel
+    from concurrent.futures import ProcessPoolExecutor
+
+    outs = [[cache.get(n, braid) for braid in braids] for n, braids in jobs]
+    misses = [[i for i, word in enumerate(out) if word is None] for out in outs]
+    if any(misses):
+        with ProcessPoolExecutor(max_workers=processes) as executor:
+            futures = [
+                executor.submit(
+                    canonical_words_with, _selection.name, n, [braids[i] for i in todo]
+                )
+                for (n, braids), todo in zip(jobs, misses)
+                if todo
+            ]
+            found = iter(futures)
+            for (n, braids), out, todo in zip(jobs, outs, misses):
+                if todo:
+                    for i, word in zip(todo, next(found).result()):
+                        cache.put(n, braids[i], word)
+                        out[i] = word
+    return [[word if word is not None else [] for word in out] for out in outs]
+
+
+def _save_cache(path: str) -> None:
+    """Saves the cache under the engine selected at exit
+
+    Args:
+        path (str): File to write
+    """
+    cache.save(path, _selection.name)
+
+
+set_backend(os.environ.get("BRAID_CANON_BACKEND", "native"))
+
+if "BRAID_CANON_CACHE_FILE" in os.environ:
+    cache.load(os.environ["BRAID_CANON_CACHE_FILE"], _selection.name)
+    atexit.register(_save_cache, os.environ["BRAID_CANON_CACHE_FILE"])
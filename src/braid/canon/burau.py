@@ -0,0 +1,118 @@
+"""The Burau representation of braids, evaluated at a random
+point modulo a large prime. Equivalent braids always get
+the same matrix, so different matrices prove two braids
+aren't equivalent; equal matrices only make it likely. The
+point is drawn once per process, so no fixed pair of braids
+collides every time, and matrices from different processes
+can't be compared.
+
+Matrices are flat row-major lists of n * n ints. Multiplying
+by a generator only touches two rows or columns, so braids
+can keep their matrix up to date in O(n) per generator."""
+
+import secrets
+from typing import List, Sequence
+
+PRIME = (1 << 61) - 1
+# the evaluation point, and the point digest evaluates the
+# matrix entries at; 0 and 1 would lose the braid's sign
+T = secrets.randbelow(PRIME - 2) + 2
+T_INV = pow(T, PRIME - 2, PRIME)
+S = secrets.randbelow(PRIME - 2) + 2
+
+Matrix = List[int]
+
+
+def identity(n: int) -> Matrix:
+    """Makes the matrix of the trivial braid
+
+    Args:
+        n (int): Number of strands
+
+    Returns:
+        Matrix: n by n identity
+    """
+    m = [0] * (n * n)
+    for i in range(n):
+        m[i * n + i] = 1
+    return m
+
+
+def multiply_right(m: Matrix, n: int, g: int) -> None:
+    """Replaces m with m times the matrix of a generator,
+    so the generator goes at the end of the braid
+
+    Args:
+        m (Matrix): Matrix on n strands, mutated
+        n (int): Number of strands
+        g (int): Generator, 1-indexed, negative for an inverse
+    """
+    i = abs(g) - 1
+    for r in range(i, n * n, n):
+        a = m[r]
+        b = m[r + 1]
+        if g > 0:
+            # (a, b) [[1 - t, t], [1, 0]]
+            m[r] = (a * (1 - T) + b) % PRIME
+            m[r + 1] = a * T % PRIME
+        else:
+            # (a, b) [[0, 1], [1 / t, 1 - 1 / t]]
+            m[r] = b * T_INV % PRIME
+            m[r + 1] = (a + b * (1 - T_INV)) % PRIME
+
+
+def multiply_left(m: Matrix, n: int, g: int) -> None:
+    """Replaces m with the matrix of a generator times m,
+    so the generator goes at the start of the braid
+
+    Args:
+        m (Matrix): Matrix on n strands, mutated
+        n (int): Number of strands
+        g (int): Generator, 1-indexed, negative for an inverse
+    """
+    i = abs(g) - 1
+    top = i * n
+    for c in range(n):
+        a = m[top + c]
+        b = m[top + n + c]
+        if g > 0:
+            m[top + c] = (a * (1 - T) + b * T) % PRIME
+            m[top + n + c] = a
+        else:
+            m[top + c] = b
+            m[top + n + c] = (a * T_INV + b * (1 - T_INV)) % PRIME
+
+
+def of_word(n: int, word: Sequence[int]) -> Matrix:
+    """Computes the matrix of a braid word
+
+    Args:
+        n (int): Number of strands
+        word (Sequence[int]): Generators, 1-indexed, negative
+        to represent inverses
+
+    Returns:
+        Matrix: Burau matrix of the word
+    """
+    m = identity(n)
+    for g in word:
+        multiply_right(m, n, g)
+    return m
+
+
+def digest(m: Matrix) -> int:
+    """Hashes a matrix down to one int, by reading its entries
+    as the coefficients of a polynomial evaluated at S. Two
+    different matrices on n strands get the same digest with
+    probability at most n * n / PRIME
+
+    Args:
+        m (Matrix): Matrix
+
+    Returns:
+        int: Digest, below PRIME
+    """
+    h = 0
+    for x in m:
+        h = (h * S + x) % PRIME
+    return h
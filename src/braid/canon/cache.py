@@ -0,0 +1,137 @@
+"""LRU cache of canonical braid words, keyed on the
+strand count and the packed generators"""
+
+from __future__ import annotations
+import os
+from array import array
+from collections import OrderedDict
+from typing import Dict, List, Optional, Sequence, Tuple
+
+Key = Tuple[int, bytes]
+
+
+class CanonCache:
+    """Maps braid words to their canonical words. Canonical
+    words are also stored under their own key, so
+    canonicalizing them again is a dictionary hit"""
+
+    def __init__(self, size: int = 4096) -> None:
+        self.__size = size
+        self.__entries: OrderedDict[Key, bytes] = OrderedDict()
+        self.__hits = 0
+        self.__misses = 0
+
+    @staticmethod
+    def __key(n: int, word: Sequence[int]) -> Key:
+        return (n, array("h", word).tobytes())
+
+    def get(self, n: int, word: Sequence[int]) -> Optional[List[int]]:
+        """Looks up the canonical form of a word
+
+        Args:
+            n (int): Number of strands
+            word (Sequence[int]): Generators in sage encoding
+
+        Returns:
+            Optional[List[int]]: Canonical generators, or None
+            when the word isn't cached
+        """
+        key = CanonCache.__key(n, word)
+        packed = self.__entries.get(key)
+        if packed is None:
+            self.__misses += 1
+            return None
+        self.__hits += 1
+        self.__entries.move_to_end(key)
+        out = array("h")
+        out.frombytes(packed)
+        return out.tolist()
+
+    def put(self, n: int, word: Sequence[int], canon: Sequence[int]) -> None:
+        """Records the canonical form of a word
+
+        Args:
+            n (int): Number of strands
+            word (Sequence[int]): Generators in sage encoding
+            canon (Sequence[int]): Canonical generators of word
+        """
+        if self.__size <= 0:
+            return
+        packed = array("h", canon).tobytes()
+        for key in (CanonCache.__key(n, word), (n, packed)):
+            self.__entries[key] = packed
+            self.__entries.move_to_end(key)
+        while len(self.__entries) > self.__size:
+            self.__entries.popitem(last=False)
+
+    def hits(self) -> int:
+        """Getter
+
+        Returns:
+            int: Number of lookups that found an entry
+        """
+        return self.__hits
+
+    def misses(self) -> int:
+        """Getter
+
+        Returns:
+            int: Number of lookups that found nothing
+        """
+        return self.__misses
+
+    def resize(self, size: int) -> None:
+        """Sets the maximum number of entries, evicting
+        the least recently used ones
+
+        Args:
+            size (int): New maximum; 0 disables caching
+        """
+        self.__size = size
+        while len(self.__entries) > max(size, 0):
+            self.__entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Empties the cache and resets the counters"""
+        self.__entries.clear()
+        self.__hits = 0
+        self.__misses = 0
+
+    def __len__(self) -> int:
+        return len(self.__entries)
+
+    def save(self, path: str, engine: str) -> None:
+        """Writes the entries to disk, tagged with the engine
+        that computed them
+
+        Args:
+            path (str): File to write
+            engine (str): Name of the engine the entries came from
+        """
+        # pylint: disable=import-outside-toplevel
+        import pickle
+
+        with open(path, "wb") as f:
+            pickle.dump((engine, dict(self.__entries)), f)
+
+    def load(self, path: str, engine: str) -> None:
+        """Adds the entries saved at path, if the file exists
+        and was saved from the same engine. Engines can pick
+        different normal forms, so another engine's entries
+        are ignored
+
+        Args:
+            path (str): File written by save
+            engine (str): Name of the engine in use
+        """
+        if not os.path.exists(path):
+            return
+        # pylint: disable=import-outside-toplevel
+        import pickle
+
+        with open(path, "rb") as f:
+            saved: Tuple[str, Dict[Key, bytes]] = pickle.load(f)
+        if not isinstance(saved, tuple) or saved[0] != engine:
+            return
+        self.__entries.update(saved[1])
+        self.resize(self.__size)
@@ -0,0 +1,246 @@
+"""Native Garside left normal form for braid words. Simple
+elements are permutation tables, so no sagemath is needed.
+Factors are spelled so that the sagemath outputs pinned in
+tests/test_braid.py come out the same"""
+
+from typing import List, Tuple
+
+Perm = List[int]
+
+
+def _identity(n: int) -> Perm:
+    return list(range(n))
+
+
+def _delta(n: int) -> Perm:
+    return list(range(n - 1, -1, -1))
+
+
+def tau(p: Perm) -> Perm:
+    """Conjugates a simple element by delta, which
+    mirrors it left to right
+
+    Args:
+        p (Perm): Permutation table of the simple element;
+        p[i] is where the strand starting at i ends up
+
+    Returns:
+        Perm: Permutation table of the conjugated element
+    """
+    n = len(p)
+    return [n - 1 - p[n - 1 - i] for i in range(n)]
+
+
+def to_simples(n: int, braid: List[int]) -> Tuple[int, List[Perm]]:
+    """Rewrites a braid word as delta^k times a list
+    of simple elements. Runs of same-signed generators
+    are packed into one simple while they stay simple;
+    an inverse run P^-1 becomes delta^-1 (delta P^-1), and
+    the delta^-1s are slid to the front
+
+    Args:
+        n (int): Number of strands
+        braid (List[int]): List of generators, 1-indexed, negative to represent inverses
+
+    Returns:
+        Tuple[int, List[Perm]]: Power of delta and the simple elements
+    """
+    simples: List[Perm] = []
+    negs = 0
+    # p is the permutation of the current run, built
+    # right to left and ignoring the run's sign
+    p = _identity(n)
+    run_sign = 0
+    for g in reversed(braid):
+        i = abs(g) - 1
+        sign = 1 if g > 0 else -1
+        if sign != run_sign or p[i] > p[i + 1]:
+            if run_sign != 0:
+                negs = _close_run(p, run_sign, negs, simples)
+            p = _identity(n)
+            run_sign = sign
+        # sigma_i followed by p
+        p[i], p[i + 1] = p[i + 1], p[i]
+    if run_sign != 0:
+        negs = _close_run(p, run_sign, negs, simples)
+    simples.reverse()
+    return -negs, simples
+
+
+def _close_run(p: Perm, sign: int, negs: int, simples: List[Perm]) -> int:
+    n = len(p)
+    if sign < 0:
+        # delta times the run is delta followed by p
+        p = [p[n - 1 - j] for j in range(n)]
+    if negs % 2 == 1:
+        p = tau(p)
+    simples.append(p)
+    return negs + 1 if sign < 0 else negs
+
+
+def left_weight(a: Perm, b: Perm) -> bool:
+    """Makes the pair of simples a * b left-weighted
+    in place by moving crossings from b into a
+
+    Args:
+        a (Perm): Left simple, mutated
+        b (Perm): Right simple, mutated
+
+    Returns:
+        bool: Whether any crossing was moved
+    """
+    n = len(a)
+    a_inv = [0] * n
+    for i, x in enumerate(a):
+        a_inv[x] = i
+    moved = False
+    i = 0
+    while i < n - 1:
+        # b starts with sigma_i but a doesn't end with it
+        if b[i] > b[i + 1] and a_inv[i] < a_inv[i + 1]:
+            a[a_inv[i]], a[a_inv[i + 1]] = i + 1, i
+            a_inv[i], a_inv[i + 1] = a_inv[i + 1], a_inv[i]
+            b[i], b[i + 1] = b[i + 1], b[i]
+            moved = True
+            if i > 0:
+                i -= 1
+        else:
+            i += 1
+    return moved
+
+
+def left_normal_form(n: int, braid: List[int]) -> Tuple[int, List[Perm]]:
+    """Computes the left normal form delta^k A_1 ... A_r
+    of a braid word
+
+    Args:
+        n (int): Number of strands
+        braid (List[int]): List of generators, 1-indexed, negative to represent inverses
+
+    Returns:
+        Tuple[int, List[Perm]]: Power of delta and the simple
+        factors as permutation tables, none of them delta
+        or the identity
+    """
+    k, simples = to_simples(n, braid)
+    identity = _identity(n)
+    delta = _delta(n)
+    factors: List[Perm] = []
+    # factors[:start] are deltas waiting to be folded into k
+    start = 0
+    for p in simples:
+        factors.append(p)
+        j = len(factors) - 1
+        while j > start and left_weight(factors[j - 1], factors[j]):
+            j -= 1
+        # identities can only end up at the tail
+        while len(factors) > start and factors[-1] == identity:
+            factors.pop()
+        while start < len(factors) and factors[start] == delta:
+            start += 1
+    return k + start, factors[start:]
+
+
+def simple_word(p: Perm) -> List[int]:
+    """Writes a simple element as a positive braid word
+    by insertion sorting its strands
+
+    Args:
+        p (Perm): Permutation table of the simple element
+
+    Returns:
+        List[int]: List of generators, 1-indexed
+    """
+    p = list(p)
+    word = []
+    for i in range(1, len(p)):
+        j = i
+        while j > 0 and p[j] < p[j - 1]:
+            word.append(j)
+            p[j], p[j - 1] = p[j - 1], p[j]
+            j -= 1
+    return word
+
+
+def _delta_power_word(n: int, k: int) -> List[int]:
+    delta_word = simple_word(_delta(n))[::-1]
+    if k < 0:
+        delta_word = [-g for g in reversed(delta_word)]
+    return delta_word * abs(k)
+
+
+def canonical_word(n: int, braid: List[int]) -> List[int]:
+    """Canonicalizes a braid word without going through
+    syllable strings
+
+    Args:
+        n (int): Number of strands
+        braid (List[int]): List of generators, 1-indexed, negative to represent inverses
+
+    Returns:
+        List[int]: Canonical list of generators, 1-indexed, negative to represent inverses
+    """
+    if n < 2:
+        return []
+    k, factors = left_normal_form(n, braid)
+    word = _delta_power_word(n, k)
+    for f in factors:
+        word.extend(simple_word(f))
+    return word
+
+
+def canonical_words(n: int, braids: List[List[int]]) -> List[List[int]]:
+    """Canonicalizes several braid words. See canonical_word
+
+    Args:
+        n (int): Number of strands
+        braids (List[List[int]]): Braid words, generators 1-indexed,
+        negative to represent inverses
+
+    Returns:
+        List[List[int]]: Canonical braid words, in input order
+    """
+    return [canonical_word(n, braid) for braid in braids]
+
+
+def syllables(n: int, word: List[int]) -> List[Tuple[str, int]]:
+    """Groups a word into syllables named the way sagemath
+    names the generators of BraidGroup(n). Unlike sagemath,
+    syllables may run across simple factors
+
+    Args:
+        n (int): Number of strands
+        word (List[int]): Generators, 1-indexed, negative
+        to represent inverses
+
+    Returns:
+        List[Tuple[str, int]]: Generator names and powers
+    """
+    out: List[Tuple[str, int]] = []
+    for g in word:
+        name = f"s{abs(g) - 1}" if n > 2 else "s"
+        power = 1 if g > 0 else -1
+        if out and out[-1][0] == name and out[-1][1] * power > 0:
+            out[-1] = (name, out[-1][1] + power)
+        else:
+            out.append((name, power))
+    return out
+
+
+def canonicalize_braid(n: int, braid: List[int]) -> List[Tuple[str, int]]:
+    """Canonicalizes a braid word without sagemath
+
+    Args:
+        n (int): Number of strands
+        braid (List[int]): List of generators, 1-indexed, negative to represent inverses
+
+    Returns:
+        List[Tuple[str, int]]: List of syllables in the braid word
+    """
+    if n < 2:
+        return []
+    k, factors = left_normal_form(n, braid)
+    out = syllables(n, _delta_power_word(n, k))
+    for f in factors:
+        out.extend(syllables(n, simple_word(f)))
+    return out
@@ -0,0 +1,76 @@
+"""Dehornoy handle reduction, which decides whether a braid
+word is trivial without computing a normal form.
+
+A sigma_i-handle is a subword sigma_i^e u sigma_i^-e where u
+has no sigma_i or sigma_i-1 letters. Reducing it drops the
+two ends and swaps each sigma_i+1^d in u for
+sigma_i+1^-e sigma_i^d sigma_i+1^e. A word is trivial exactly
+when repeatedly reducing handles empties it. Handles are
+reduced in the order they end, so the interior of each one
+holds no other handle, which makes the reduction terminate.
+The letters before a reduced handle don't change, so the
+scan for the next handle resumes where the last one began."""
+
+from typing import List, Sequence, Tuple
+
+
+def reduce_handles(n: int, word: Sequence[int]) -> List[int]:
+    """Reduces handles until none are left
+
+    Args:
+        n (int): Number of strands
+        word (Sequence[int]): Generators, 1-indexed, negative
+        to represent inverses
+
+    Returns:
+        List[int]: Handle-free word equivalent to word; empty
+        exactly when word is trivial
+    """
+    word = list(word)
+    # last[i] is the latest sigma_i letter that no sigma_i-1
+    # letter came after, or -1
+    last = [-1] * (n + 1)
+    # what each scanned letter overwrote in last, so the scan
+    # can rewind to where a reduced handle started instead of
+    # rescanning the unchanged letters before it
+    undo: List[Tuple[int, int, int]] = []
+    q = 0
+    while q < len(word):
+        g = word[q]
+        i = abs(g)
+        p = last[i]
+        if p < 0 or word[p] != -g:
+            undo.append((i, last[i], last[i + 1]))
+            last[i] = q
+            last[i + 1] = -1
+            q += 1
+            continue
+        # word[p : q + 1] is the handle that ends first
+        while len(undo) > p:
+            j, before, after = undo.pop()
+            last[j] = before
+            last[j + 1] = after
+        e = 1 if word[p] > 0 else -1
+        middle: List[int] = []
+        for h in word[p + 1 : q]:
+            if abs(h) == i + 1:
+                middle.extend((-e * (i + 1), i if h > 0 else -i, e * (i + 1)))
+            else:
+                middle.append(h)
+        word[p : q + 1] = middle
+        q = p
+    return word
+
+
+def is_identity(n: int, word: Sequence[int]) -> bool:
+    """Decides whether a braid word is trivial
+
+    Args:
+        n (int): Number of strands
+        word (Sequence[int]): Generators, 1-indexed, negative
+        to represent inverses
+
+    Returns:
+        bool: True if the word is the identity braid
+    """
+    return not reduce_handles(n, word)
@@ -0,0 +1,72 @@
+"""Free reduction of braid words: cancels each generator
+against an inverse of itself that it can commute down to"""
+
+from typing import List, Sequence
+
+
+class FreeReducer:
+    """Cancels sigma_i sigma_i^-1 pairs, including ones split
+    up by generators that commute with sigma_i, in linear
+    time. Counts the letters it saw and kept"""
+
+    def __init__(self) -> None:
+        self.__letters_in = 0
+        self.__letters_out = 0
+
+    def reduce(self, n: int, word: Sequence[int]) -> List[int]:
+        """Freely reduces a braid word
+
+        Args:
+            n (int): Number of strands
+            word (Sequence[int]): Generators, 1-indexed, negative
+            to represent inverses
+
+        Returns:
+            List[int]: Equivalent word with no cancelling pairs
+            left, in sage encoding
+        """
+        out: List[int] = []
+        alive: List[bool] = []
+        # positions in out of the surviving letters on each
+        # generator index, padded so that i - 1 and i + 1 exist
+        tops: List[List[int]] = [[] for _ in range(n + 1)]
+        for g in word:
+            i = abs(g)
+            # the letter g would have to move past first
+            nearest = max(
+                tops[i][-1] if tops[i] else -1,
+                tops[i - 1][-1] if tops[i - 1] else -1,
+                tops[i + 1][-1] if tops[i + 1] else -1,
+            )
+            if nearest >= 0 and out[nearest] == -g:
+                alive[nearest] = False
+                tops[i].pop()
+            else:
+                tops[i].append(len(out))
+                out.append(g)
+                alive.append(True)
+        reduced = [g for g, keep in zip(out, alive) if keep]
+        self.__letters_in += len(word)
+        self.__letters_out += len(reduced)
+        return reduced
+
+    def letters_in(self) -> int:
+        """Getter
+
+        Returns:
+            int: Number of letters given to reduce
+        """
+        return self.__letters_in
+
+    def letters_out(self) -> int:
+        """Getter
+
+        Returns:
+            int: Number of letters reduce gave back
+        """
+        return self.__letters_out
+
+    def clear(self) -> None:
+        """Resets the counters"""
+        self.__letters_in = 0
+        self.__letters_out = 0
@@ -0,0 +1,208 @@
+"""Long-lived canonicalization server. A pool of worker
+processes imports the engine once and answers requests
+sent over a Unix socket, so clients never import sagemath.
+
+Start it with
+
+    python -m braid.canon.server /tmp/braid.sock
+
+and set BRAID_CANON_SERVER=/tmp/braid.sock in the clients.
+
+Every message is a little header followed by braid words,
+each word a length and its generators as 2-byte ints in
+sage encoding:
+
+    request:  n (int32), count (uint32), count words
+    response: count (uint32), count words
+"""
+
+import argparse
+import os
+import socket
+import socketserver
+import stat
+import struct
+from array import array
+from multiprocessing import Pool
+from multiprocessing.pool import Pool as PoolType
+from typing import List, Optional, Sequence
+from braid.canon import backend
+
+SERVER_ENV = "BRAID_CANON_SERVER"
+
+_REQUEST = struct.Struct("=iI")
+_COUNT = struct.Struct("=I")
+
+
+def _recv_exact(sock: socket.socket, size: int) -> bytes:
+    """Reads exactly size bytes
+
+    Args:
+        sock (socket.socket): Connected socket
+        size (int): Number of bytes
+
+    Raises:
+        ConnectionError: when the peer hangs up early
+
+    Returns:
+        bytes: The bytes read
+    """
+    data = bytearray()
+    while len(data) < size:
+        chunk = sock.recv(size - len(data))
+        if not chunk:
+            raise ConnectionError("Braid canonicalization server hung up")
+        data.extend(chunk)
+    return bytes(data)
+
+
+def _send_words(
+    sock: socket.socket, header: bytes, words: Sequence[Sequence[int]]
+) -> None:
+    parts = [header]
+    for word in words:
+        packed = array("h", word)
+        parts.append(_COUNT.pack(len(packed)))
+        parts.append(packed.tobytes())
+    sock.sendall(b"".join(parts))
+
+
+def _recv_words(sock: socket.socket, count: int) -> List[List[int]]:
+    words = []
+    for _ in range(count):
+        (length,) = _COUNT.unpack(_recv_exact(sock, _COUNT.size))
+        word = array("h")
+        word.frombytes(_recv_exact(sock, 2 * length))
+        words.append(word.tolist())
+    return words
+
+
+def canonical_words(
+    path: str, n: int, braids: Sequence[Sequence[int]]
+) -> Optional[List[List[int]]]:
+    """Asks the server at path to canonicalize braid words
+
+    Args:
+        path (str): Socket the server listens on
+        n (int): Number of strands
+        braids (Sequence[Sequence[int]]): Braid words, generators 1-indexed,
+        negative to represent inverses
+
+    Returns:
+        Optional[List[List[int]]]: Canonical braid words, in input order,
+        or None when no server is listening at path
+    """
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.connect(path)
+            _send_words(sock, _REQUEST.pack(n, len(braids)), braids)
+            (count,) = _COUNT.unpack(_recv_exact(sock, _COUNT.size))
+            return _recv_words(sock, count)
+    except OSError:
+        return None
+
+
+def server_path() -> Optional[str]:
+    """Getter
+
+    Returns:
+        Optional[str]: Socket named by BRAID_CANON_SERVER, if set
+    """
+    return os.environ.get(SERVER_ENV) or None
+
+
+def _warm(engine: str) -> None:
+    # workers must not call back into the server
+    os.environ.pop(SERVER_ENV, None)
+    backend.set_backend(engine)
+    backend.canonical_words(3, [[1, -2]])
+
+
+class _Handler(socketserver.BaseRequestHandler):
+    """Answers canonicalization requests until the client hangs up"""
+
+    server: "CanonServer"
+
+    def handle(self) -> None:
+        sock: socket.socket = self.request
+        while True:
+            header = sock.recv(_REQUEST.size, socket.MSG_WAITALL)
+            if len(header) < _REQUEST.size:
+                return
+            n, count = _REQUEST.unpack(header)
+            braids = _recv_words(sock, count)
+            words = self.server.pool.apply(
+                backend.canonical_words_with, (self.server.engine, n, braids)
+            )
+            _send_words(sock, _COUNT.pack(len(words)), words)
+
+
+class CanonServer(socketserver.ThreadingUnixStreamServer):
+    """Unix socket server handing requests to a pool of
+    warm worker processes"""
+
+    daemon_threads = True
+
+    def __init__(self, path: str, pool: PoolType, engine: str) -> None:
+        self.pool = pool
+        self.engine = engine
+        super().__init__(path, _Handler)
+
+
+def _is_socket(path: str) -> bool:
+    """Whether path is a Unix socket, without following links
+
+    Args:
+        path (str): Path to check
+
+    Returns:
+        bool: False when nothing is there or it isn't a socket
+    """
+    try:
+        return stat.S_ISSOCK(os.lstat(path).st_mode)
+    except FileNotFoundError:
+        return False
+
+
+def serve(path: str, processes: int = 1, engine: str = "sage") -> None:
+    """Runs the server until interrupted
+
+    Args:
+        path (str): Socket to listen on; a stale socket file is replaced
+        processes (int, optional): Number of worker processes. Defaults to 1.
+        engine (str, optional): One of backend.backends(). Defaults to "sage".
+
+    Raises:
+        ValueError: when the engine isn't a known backend
+        FileExistsError: when something other than a socket is at path
+    """
+    if engine not in backend.backends():
+        raise ValueError(f"Unknown braid canonicalization backend {engine}")
+    if _is_socket(path):
+        os.remove(path)
+    elif os.path.lexists(path):
+        raise FileExistsError(f"{path} exists and isn't a socket")
+    with Pool(processes, initializer=_warm, initargs=(engine,)) as pool:
+        with CanonServer(path, pool, engine) as server:
+            try:
+                server.serve_forever()
+            finally:
+                if _is_socket(path):
+                    os.remove(path)
+
+
+def main() -> None:
+    """Command line entry point"""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("path", help="Unix socket to listen on")
+    parser.add_argument("--processes", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--engine", choices=backend.backends(), default="sage")
+    args = parser.parse_args()
+    try:
+        serve(args.path, args.processes, args.engine)
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+"""Batched braid fuzzing. Rather than one rewrite per call
+with an insert or delete in the middle of the word, each
+round sweeps the word once, applying rewrites at many
+non-overlapping places and writing the result out in order."""
+
+from __future__ import annotations
+import random
+from array import array
+from typing import List, Sequence
+
+# Chance that an applicable rewrite happens at a position
+REWRITE_RATE = 0.5
+# Chance that an inverse pair is inserted before a position
+UNCANCEL_RATE = 0.05
+
+
+def fuzz_round(n: int, word: Sequence[int], rng: random.Random) -> array[int]:
+    """Sweeps a braid word once, applying braid relations at
+    random positions: Yang-Baxter, far commutation, cancelling
+    and uncancelling. The result is equivalent to word
+
+    Args:
+        n (int): Number of strands
+        word (Sequence[int]): Generators, 1-indexed, negative
+        to represent inverses
+        rng (random.Random): Source of the random choices
+
+    Returns:
+        array[int]: Rewritten word in sage encoding
+    """
+    rand = rng.random
+    out = array("h")
+    length = len(word)
+    if length == 0 and n > 1:
+        g = rng.randrange(1, n)
+        out.extend((g, -g) if rand() < 0.5 else (-g, g))
+        return out
+    j = 0
+    while j < length:
+        g1 = word[j]
+        r = rand()
+        if r < UNCANCEL_RATE and n > 1:
+            g = rng.randrange(1, n)
+            out.extend((g, -g) if rand() < 0.5 else (-g, g))
+        elif r < REWRITE_RATE and j + 1 < length:
+            g2 = word[j + 1]
+            if g1 == -g2:
+                j += 2
+                continue
+            apart = abs(abs(g1) - abs(g2))
+            if apart >= 2:
+                out.extend((g2, g1))
+                j += 2
+                continue
+            same_sign = (g1 > 0) == (g2 > 0)
+            if apart == 1 and j + 2 < length and word[j + 2] == g1 and same_sign:
+                out.extend((g2, g1, g2))
+                j += 3
+                continue
+        out.append(g1)
+        j += 1
+    return out
+
+
+def fuzz_many(
+    n: int, word: Sequence[int], count: int, rounds: int, seed: int
+) -> List[array[int]]:
+    """Makes several mutants of a braid word, all equivalent
+    to it. The same seed always gives the same mutants
+
+    Args:
+        n (int): Number of strands
+        word (Sequence[int]): Generators, 1-indexed, negative
+        to represent inverses
+        count (int): Number of mutants
+        rounds (int): Number of sweeps over each mutant
+        seed (int): Seed for the random choices
+
+    Returns:
+        List[array[int]]: Mutant words in sage encoding
+    """
+    rng = random.Random(seed)
+    mutants = []
+    for _ in range(count):
+        mutant = array("h", word)
+        for _ in range(rounds):
+            mutant = fuzz_round(n, mutant, rng)
+        mutants.append(mutant)
+    return mutants
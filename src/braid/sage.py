@@ -1,9 +1,9 @@
-"""For interacting with sagemath"""
+"""For interacting with sagemath. When BRAID_CANON_SERVER names
+a running canonicalization server (see braid.canon.server),
+requests go there and sagemath is never imported here"""
 
 from typing import List, Tuple
-
-# pylint: disable=no-name-in-module
-from sage.all import BraidGroup  # type: ignore
+from braid.canon import garside, server
 
 
 def canonicalize_braid(n: int, braid: List[int]) -> List[Tuple[str, int]]:
@@ -16,10 +16,63 @@ def canonicalize_braid(n: int, braid: List[int]) -> List[Tuple[str, int]]:
     Returns:
         List[Tuple[str, int]]: List of syllables in the braid word
     """
+    return canonicalize_many(n, [braid])[0]
+
+
+def canonicalize_many(n: int, braids: List[List[int]]) -> List[List[Tuple[str, int]]]:
+    """Calls sagemath to canonicalize several braid words
+    on the same number of strands, building the braid
+    group once
+
+    Args:
+        n (int): Number of strands
+        braids (List[List[int]]): Braid words, each a list of generators,
+        1-indexed, negative to represent inverses
+
+    Returns:
+        List[List[Tuple[str, int]]]: Syllables of each canonical braid word
+    """
     if n < 2:
-        return []
-    normal_form = BraidGroup(n)(braid).left_normal_form()
-    return sum(
-        [[(str(g), int(p)) for (g, p) in s.syllables()] for s in normal_form],
-        [],
-    )
+        return [[] for _ in braids]
+    path = server.server_path()
+    if path is not None:
+        words = server.canonical_words(path, n, braids)
+        if words is not None:
+            return [garside.syllables(n, word) for word in words]
+
+    # pylint: disable=import-outside-toplevel,no-name-in-module
+    from sage.all import BraidGroup  # type: ignore
+
+    group = BraidGroup(n)
+    out = []
+    for braid in braids:
+        normal_form = group(braid).left_normal_form()
+        out.append(
+            sum(
+                [[(str(g), int(p)) for (g, p) in s.syllables()] for s in normal_form],
+                [],
+            )
+        )
+    return out
+
+
+def canonical_words(n: int, braids: List[List[int]]) -> List[List[int]]:
+    """Calls sagemath to canonicalize several braid words,
+    returning the generators rather than syllables
+
+    Args:
+        n (int): Number of strands
+        braids (List[List[int]]): Braid words, generators 1-indexed,
+        negative to represent inverses
+
+    Returns:
+        List[List[int]]: Canonical braid words, in input order
+    """
+    words = []
+    for syllables in canonicalize_many(n, braids):
+        word = []
+        for name, power in syllables:
+            g = int(name[1:]) + 1 if n > 2 else 1
+            word.extend([g if power > 0 else -g] * abs(power))
+        words.append(word)
+    return words
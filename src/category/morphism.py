@@ -3,7 +3,7 @@ are black boxes that take some strands
 to other strands"""
 
 from __future__ import annotations
-from typing import Dict, Optional, Sequence, TypeGuard
+from typing import Dict, Optional, Sequence, Tuple, TypeGuard
 from category.object import Loop, PrimitiveObject
 from common.common import Bed, Dir
 from fig_gen.latex import Latex
@@ -24,17 +24,28 @@ class Knit(Latex):
         self.__bed = bed
         self.__dir = d
         # TODO: check this is a valid knit
-        self.__ins = ins
-        self.__outs = outs
+        # copied, so the caller can't make the cache stale
+        self.__ins = list(ins)
+        self.__outs = list(outs)
+        self.__compact()
+
+    def __compact(self) -> None:
+        # the true ins and outs without the slurped strands,
+        # kept until the knit is flipped
+        self.__true_ins = tuple(filter(Knit.__is_not_none, self.__ins))
+        self.__true_outs = tuple(filter(Knit.__is_not_none, self.__outs))
+        i = self.__primary_index_pre_slurp()
+        self.__primary_index = i - self.__outs[:i].count(None)
 
     def __eq__(self, other: object) -> bool:
+        # pylint: disable=protected-access
         if not isinstance(other, Knit):
             return False
         return (
             self.bed() == other.bed()
             and self.dir() == other.dir()
-            and all(i1.eqv(i2) for (i1, i2) in zip(self.ins(), other.ins()))
-            and all(o1.eqv(o2) for (o1, o2) in zip(self.outs(), other.outs()))
+            and all(i1.eqv(i2) for (i1, i2) in zip(self.__true_ins, other.__true_ins))
+            and all(o1.eqv(o2) for (o1, o2) in zip(self.__true_outs, other.__true_outs))
             and self.dropped_ins() == other.dropped_ins()
             and self.dropped_outs() == other.dropped_outs()
         )
@@ -81,12 +92,33 @@ class Knit(Latex):
             ],
         )
 
+    def relink(self, objects: Dict[PrimitiveObject, PrimitiveObject]) -> Knit:
+        """Copies this Knit, swapping in the replacement of
+        each object that has one and sharing the rest
+
+        Args:
+            objects (Dict[PrimitiveObject, PrimitiveObject]): Replacement
+            for each replaced object
+
+        Returns:
+            Knit: Relinked Knit, or this Knit if none of its
+            objects are replaced
+        """
+        if not any(o in objects for o in self.__true_ins + self.__true_outs):
+            return self
+        return Knit(
+            self.__bed,
+            self.__dir,
+            [objects.get(o, o) if o is not None else None for o in self.__ins],
+            [objects.get(o, o) if o is not None else None for o in self.__outs],
+        )
+
     def to_latex(self, x: int, y: int, context: Sequence[PrimitiveObject]) -> str:
         latex_str = ""
-        width = max(len(self.ins()), len(self.outs()))
+        width = max(self.n_ins(), self.n_outs())
         latex_str += f"""\\knit{{{self.__dir}}}{{{self.__bed}}}
 {{{width}}}{{{width}}}{{{x}}}{{{y}}}\n"""
-        for i, o in enumerate(self.outs()):
+        for i, o in enumerate(self.__true_outs):
             (r, g, b) = o.color()
             for j in range(abs(o.twists())):
                 latex_str += f"""\\twist{{{'pos' if o.twists() > 0 else 'neg'}}}
@@ -103,7 +135,7 @@ class Knit(Latex):
 
     def __max_twists(self) -> int:
         max_twists = 0
-        for o in self.outs():
+        for o in self.__true_outs:
             max_twists = max(max_twists, abs(o.twists()))
         return max_twists
 
@@ -118,7 +150,25 @@ class Knit(Latex):
         Returns:
             list[PrimitiveObject]: Output objects
         """
-        return list(filter(Knit.__is_not_none, self.__outs))
+        return list(self.__true_outs)
+
+    def true_outs(self) -> Tuple[PrimitiveObject, ...]:
+        """Getter for the cached output objects, for
+        reading them without building a list
+
+        Returns:
+            Tuple[PrimitiveObject, ...]: Output objects
+        """
+        return self.__true_outs
+
+    def n_outs(self) -> int:
+        """Counts the objects that come out
+        of the knit, without building them
+
+        Returns:
+            int: Number of output objects
+        """
+        return len(self.__true_outs)
 
     def ins(self) -> list[PrimitiveObject]:
         """Computes the objects that come
@@ -127,7 +177,25 @@ class Knit(Latex):
         Returns:
             list[PrimitiveObject]: Input objects
         """
-        return list(filter(Knit.__is_not_none, self.__ins))
+        return list(self.__true_ins)
+
+    def true_ins(self) -> Tuple[PrimitiveObject, ...]:
+        """Getter for the cached input objects, for
+        reading them without building a list
+
+        Returns:
+            Tuple[PrimitiveObject, ...]: Input objects
+        """
+        return self.__true_ins
+
+    def n_ins(self) -> int:
+        """Counts the objects that come in
+        to the knit, without building them
+
+        Returns:
+            int: Number of input objects
+        """
+        return len(self.__true_ins)
 
     def dropped_ins(self) -> list[bool]:
         """Returns a list of the in strands,
@@ -171,6 +239,7 @@ class Knit(Latex):
         # TODO: use flippable here.
         self.__bed = Bed(not self.__bed.front())
         self.__dir = Dir(not self.__dir.right())
+        self.__compact()
 
     def __primary_index_pre_slurp(self) -> int:
         match (self.__bed.front(), self.__dir.right()):
@@ -192,15 +261,10 @@ class Knit(Latex):
         Returns:
             int: 0-index from left
         """
-        i = self.__primary_index_pre_slurp()
-        before = self.__outs[:i]
-        for o in before:
-            if o is None:
-                i -= 1
-        return i
+        return self.__primary_index
 
     def __repr__(self) -> str:
-        return f"Knit(front={repr(self.__bed.front())}, right={repr(self.__dir.right())}, ins={len(self.ins())}, outs={len(self.outs())})"
+        return f"Knit(front={repr(self.__bed.front())}, right={repr(self.__dir.right())}, ins={self.n_ins()}, outs={self.n_outs()})"
 
     def __str__(self) -> str:
         return f"""[{", ".join(["slurped" if o is None else str(o) for o in self.__outs])}]
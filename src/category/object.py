@@ -68,6 +68,15 @@ class PrimitiveObject(ABC):
             is positive or negative
         """
 
+    @abstractmethod
+    def twist_by(self, k: int) -> None:
+        """Twists this object k times
+
+        Args:
+            k (int): number of twists, negative
+            for negative twists
+        """
+
     @abstractmethod
     def twists(self) -> int:
         """Returns the number of twists
@@ -103,6 +112,9 @@ class Carrier(PrimitiveObject):
     def twist(self, is_pos: bool) -> None:
         pass
 
+    def twist_by(self, k: int) -> None:
+        pass
+
     def twists(self) -> int:
         return 0
 
@@ -124,14 +136,16 @@ class Loop(PrimitiveObject):
         if self in copied_object_dict:
             return copied_object_dict[self]
         l = Loop(self.id())
-        for _ in range(abs(self.__twists)):
-            l.twist(self.__twists > 0)
+        l.twist_by(self.__twists)
         copied_object_dict[self] = l
         return l
 
     def twist(self, is_pos: bool) -> None:
         self.__twists += 1 if is_pos else -1
 
+    def twist_by(self, k: int) -> None:
+        self.__twists += k
+
     def twists(self) -> int:
         return self.__twists
 
@@ -1,10 +1,12 @@
 """
 Sets up common classes like
-Sign and Bed and Dir
+Sign and Bed and Dir. Each of them
+only ever has two instances
 """
 
 from __future__ import annotations
 from abc import ABC, abstractmethod
+from typing import Dict
 
 
 class Flippable(ABC):  # pylint: disable=too-few-public-methods
@@ -14,6 +16,8 @@ class Flippable(ABC):  # pylint: disable=too-few-public-methods
     booleans
     """
 
+    __slots__ = ()
+
     def flip(self) -> Flippable:
         """Flips the object
 
@@ -21,7 +25,12 @@ class Flippable(ABC):  # pylint: disable=too-few-public-methods
             Flippable: The inverse of
             whatever this is
         """
-        return Flippable._from_bool(not self._to_bool())
+        return self._from_bool(not self._to_bool())
+
+    def __reduce__(self) -> tuple[type[Flippable], tuple[bool]]:
+        # unpickle through the constructor, so that there
+        # are still only two instances
+        return (type(self), (self._to_bool(),))
 
     @staticmethod
     @abstractmethod
@@ -55,8 +64,17 @@ class Sign(Flippable):
     have inverses
     """
 
-    def __init__(self, is_pos: bool) -> None:
-        self.__is_pos = is_pos
+    __slots__ = ("__is_pos",)
+    __is_pos: bool
+    __instances: Dict[bool, Sign] = {}
+
+    def __new__(cls, is_pos: bool) -> Sign:
+        # pylint: disable=unused-private-member
+        if is_pos not in Sign.__instances:
+            flippable = super().__new__(cls)
+            flippable.__is_pos = is_pos
+            Sign.__instances[is_pos] = flippable
+        return Sign.__instances[is_pos]
 
     def pos(self) -> bool:
         """Getter
@@ -80,10 +98,15 @@ class Sign(Flippable):
             return "neg"
 
     def __eq__(self, other: object) -> bool:
+        if self is other:
+            return True
         if not isinstance(other, Sign):
             return False
         return self.pos() == other.pos()
 
+    def __hash__(self) -> int:
+        return hash(self.pos())
+
 
 class Dir(Flippable):
     """
@@ -91,8 +114,17 @@ class Dir(Flippable):
     the carrier strand in a knit
     """
 
-    def __init__(self, is_right: bool) -> None:
-        self.__is_right = is_right
+    __slots__ = ("__is_right",)
+    __is_right: bool
+    __instances: Dict[bool, Dir] = {}
+
+    def __new__(cls, is_right: bool) -> Dir:
+        # pylint: disable=unused-private-member
+        if is_right not in Dir.__instances:
+            flippable = super().__new__(cls)
+            flippable.__is_right = is_right
+            Dir.__instances[is_right] = flippable
+        return Dir.__instances[is_right]
 
     def right(self) -> bool:
         """Getter
@@ -115,10 +147,15 @@ class Dir(Flippable):
         return "left"
 
     def __eq__(self, other: object) -> bool:
+        if self is other:
+            return True
         if not isinstance(other, Dir):
             return False
         return self.right() == other.right()
 
+    def __hash__(self) -> int:
+        return hash(self.right())
+
 
 class Bed(Flippable):
     """
@@ -126,8 +163,17 @@ class Bed(Flippable):
     a v-bed knitting machine
     """
 
-    def __init__(self, is_front: bool) -> None:
-        self.__is_front = is_front
+    __slots__ = ("__is_front",)
+    __is_front: bool
+    __instances: Dict[bool, Bed] = {}
+
+    def __new__(cls, is_front: bool) -> Bed:
+        # pylint: disable=unused-private-member
+        if is_front not in Bed.__instances:
+            flippable = super().__new__(cls)
+            flippable.__is_front = is_front
+            Bed.__instances[is_front] = flippable
+        return Bed.__instances[is_front]
 
     def front(self) -> bool:
         """Getter
@@ -150,6 +196,11 @@ class Bed(Flippable):
         return "back"
 
     def __eq__(self, other: object) -> bool:
+        if self is other:
+            return True
         if not isinstance(other, Bed):
             return False
         return self.front() == other.front()
+
+    def __hash__(self) -> int:
+        return hash(self.front())
@@ -14,6 +14,8 @@ class Latex(ABC):
     """Interface for classes that can
     be converted to tikz"""
 
+    __slots__ = ()
+
     @abstractmethod
     def to_latex(self, x: int, y: int, context: Sequence[PrimitiveObject]) -> str:
         """Converts this class into tikz code
@@ -0,0 +1,202 @@
+"""Splits a word into components: sets of strands that no
+braid generator or box ever connects to the strands of
+another set. Strands of different components never cross,
+so every generator between two components' layers is
+passed through a layer of the other component by an index
+shift (see Layer.sigma_conj) and the layer steps of one
+component never read the other's strands. Each component
+can have its layers canonicalized as a narrower word of
+its own and be joined back in.
+
+Joining leaves each braid in the order the braids of the
+whole word would be in, but not in normal form, since the
+normal form of a braid on some strands isn't the normal
+form on all of them. The joined braids still have to be
+canonicalized at full width."""
+
+from __future__ import annotations
+from typing import Dict, List, Sequence
+from braid.braid import Braid, StrandMismatchException
+from layer.layer import Layer
+
+
+class Components:
+    """Which component each layer and each strand
+    of a word is in"""
+
+    def __init__(self, layers: Sequence[Layer], braids: Sequence[Braid]) -> None:
+        """Follows the strands up through the word, joining
+        the strands each generator crosses and the strands
+        each box takes in and puts out
+
+        Args:
+            layers (Sequence[Layer]): Layers from the bottom up
+            braids (Sequence[Braid]): Braids from the bottom up,
+            one more than there are layers
+        """
+        # union-find over strands; a box's outs share one node
+        parent: List[int] = list(range(braids[0].n()))
+        current = list(parent)
+        nodes: List[List[int]] = []
+        boxes: List[int] = []
+        for index, b in enumerate(braids):
+            nodes.append(list(current))
+            for g in b.word():
+                i = abs(g) - 1
+                parent[_find(parent, current[i])] = _find(parent, current[i + 1])
+                current[i], current[i + 1] = current[i + 1], current[i]
+            if index < len(layers):
+                l = layers[index]
+                j = l.left()
+                boxes.append(len(parent))
+                parent.append(boxes[-1])
+                for s in current[j : j + l.middle().n_ins()]:
+                    parent[_find(parent, s)] = boxes[-1]
+                current[j : j + l.middle().n_ins()] = boxes[-1:] * l.middle().n_outs()
+
+        # number the components bottom up, the ones with layers first
+        number: Dict[int, int] = {}
+        for s in boxes + [s for level in nodes for s in level]:
+            number.setdefault(_find(parent, s), len(number))
+        self.__count = len(number)
+        self.__layers = [number[_find(parent, s)] for s in boxes]
+        self.__strands = [[number[_find(parent, s)] for s in level] for level in nodes]
+
+    def count(self) -> int:
+        """Getter
+
+        Returns:
+            int: Number of components
+        """
+        return self.__count
+
+    def of_layer(self, index: int) -> int:
+        """Getter
+
+        Args:
+            index (int): Index in the layers list
+
+        Returns:
+            int: Component the layer is in
+        """
+        return self.__layers[index]
+
+    def layers_of(self, c: int) -> List[int]:
+        """Finds the layers in a component
+
+        Args:
+            c (int): Component
+
+        Returns:
+            List[int]: Indices of its layers, bottom up
+        """
+        return [i for i, x in enumerate(self.__layers) if x == c]
+
+    def width(self, index: int, c: int) -> int:
+        """Counts a component's strands at the bottom of a braid
+
+        Args:
+            index (int): Index in the braids list
+            c (int): Component
+
+        Returns:
+            int: Number of its strands
+        """
+        return self.__strands[index].count(c)
+
+    def split_braid(self, index: int, b: Braid) -> List[List[int]]:
+        """Splits a braid of the word by component
+
+        Args:
+            index (int): Index of the braid in the braids list
+            b (Braid): The braid there
+
+        Returns:
+            List[List[int]]: For each component, its generators
+            in sage encoding, numbering only its strands
+        """
+        labels = self.__strands[index]
+        rank: List[int] = []
+        seen = [0] * self.__count
+        for c in labels:
+            rank.append(seen[c])
+            seen[c] += 1
+        out: List[List[int]] = [[] for _ in range(self.__count)]
+        for g in b.word():
+            i = abs(g) - 1
+            out[labels[i]].append(rank[i] + 1 if g > 0 else -rank[i] - 1)
+        return out
+
+    def split_layer(self, index: int, l: Layer) -> Layer:
+        """Narrows a layer of the word to its component's strands
+
+        Args:
+            index (int): Index of the layer in the layers list
+            l (Layer): The layer there
+
+        Returns:
+            Layer: Layer sharing the knit, counting only the
+            strands of its component either side of the box
+        """
+        c = self.__layers[index]
+        left = self.__strands[index][: l.left()].count(c)
+        return Layer(left, l.middle(), self.width(index, c) - left - l.middle().n_ins())
+
+    def join_braid(self, index: int, c: int, word: Sequence[int]) -> List[int]:
+        """Widens a component's braid to all the word's strands
+
+        Args:
+            index (int): Index in the braids list it goes to
+            c (int): Component
+            word (Sequence[int]): Generators in sage encoding,
+            numbering only the component's strands
+
+        Raises:
+            StrandMismatchException: when a generator crosses
+                strands that another component's strands are between
+
+        Returns:
+            List[int]: Generators in sage encoding on all strands
+        """
+        positions = [p for p, x in enumerate(self.__strands[index]) if x == c]
+        out: List[int] = []
+        for g in word:
+            p = positions[abs(g) - 1]
+            if positions[abs(g)] != p + 1:
+                raise StrandMismatchException()
+            out.append(p + 1 if g > 0 else -p - 1)
+        return out
+
+    def join_layer(self, index: int, l: Layer) -> Layer:
+        """Widens a layer of a component to all the word's strands
+
+        Args:
+            index (int): Index in the layers list it goes to
+            l (Layer): Layer counting only its component's strands
+
+        Returns:
+            Layer: Layer sharing the knit. The box's outs are
+            where the component's strands above it say
+        """
+        c = self.__layers[index]
+        positions = [p for p, x in enumerate(self.__strands[index + 1]) if x == c]
+        left = positions[l.left()]
+        n = len(self.__strands[index])
+        return Layer(left, l.middle(), n - left - l.middle().n_ins())
+
+
+def _find(parent: List[int], s: int) -> int:
+    """Finds the root of a strand in a union-find forest,
+    halving the path to it
+
+    Args:
+        parent (List[int]): Parent of each node
+        s (int): Node
+
+    Returns:
+        int: Root of the node's tree
+    """
+    while parent[s] != s:
+        parent[s] = parent[parent[s]]
+        s = parent[s]
+    return s
@@ -0,0 +1,112 @@
+"""Indexes which layers of a word make and use each object.
+An object comes out of at most one knit and goes into at
+most one other, so the connections between layers form a
+graph with the objects as edges."""
+
+from __future__ import annotations
+from typing import Dict, Optional
+from category.object import PrimitiveObject
+from layer.layer import Layer
+
+
+class Connections:
+    """For each object in a word's knits, the index of the
+    layer whose knit it comes out of and the index of the
+    layer whose knit it goes into"""
+
+    def __init__(self) -> None:
+        self.__made: Dict[PrimitiveObject, int] = {}
+        self.__used: Dict[PrimitiveObject, int] = {}
+
+    def copy(self) -> Connections:
+        """Copies the index
+
+        Returns:
+            Connections: Copy
+        """
+        # pylint: disable=protected-access,unused-private-member
+        c = Connections()
+        c.__made = dict(self.__made)
+        c.__used = dict(self.__used)
+        return c
+
+    def add(self, index: int, layer: Layer) -> None:
+        """Records the objects of a layer
+
+        Args:
+            index (int): Index of the layer in the word
+            layer (Layer): Layer
+        """
+        for o in layer.middle().true_ins():
+            self.__used[o] = index
+        for o in layer.middle().true_outs():
+            self.__made[o] = index
+
+    def remove(self, layer: Layer) -> None:
+        """Forgets the objects of a layer taken off the word
+
+        Args:
+            layer (Layer): Layer
+        """
+        for o in layer.middle().true_ins():
+            self.__used.pop(o, None)
+        for o in layer.middle().true_outs():
+            self.__made.pop(o, None)
+
+    def replace(self, old: Layer, new: Layer) -> None:
+        """Moves the records of a layer's objects onto the
+        objects of its replacement, which must have the same
+        knit shape
+
+        Args:
+            old (Layer): Layer being replaced
+            new (Layer): Replacement
+        """
+        old_objects = old.middle().true_ins() + old.middle().true_outs()
+        new_objects = new.middle().true_ins() + new.middle().true_outs()
+        for o, n in zip(old_objects, new_objects):
+            if o is not n:
+                Connections.__rekey(self.__made, o, n)
+                Connections.__rekey(self.__used, o, n)
+
+    @staticmethod
+    def __rekey(
+        index: Dict[PrimitiveObject, int], old: PrimitiveObject, new: PrimitiveObject
+    ) -> None:
+        if old in index:
+            index[new] = index.pop(old)
+
+    def swap(self, index: int, below: Layer, above: Layer) -> None:
+        """Records that two adjacent layers swapped places
+
+        Args:
+            index (int): Index the below layer moved up from
+            below (Layer): Layer now at index + 1
+            above (Layer): Layer now at index
+        """
+        self.add(index + 1, below)
+        self.add(index, above)
+
+    def made_by(self, o: PrimitiveObject) -> Optional[int]:
+        """Finds the layer an object comes out of
+
+        Args:
+            o (PrimitiveObject): Object
+
+        Returns:
+            Optional[int]: Index of the layer, or None if the
+            object comes in from below the word
+        """
+        return self.__made.get(o)
+
+    def used_by(self, o: PrimitiveObject) -> Optional[int]:
+        """Finds the layer an object goes into
+
+        Args:
+            o (PrimitiveObject): Object
+
+        Returns:
+            Optional[int]: Index of the layer, or None if the
+            object goes out the top of the word
+        """
+        return self.__used.get(o)
@@ -0,0 +1,84 @@
+"""LRU cache of the braids emitted by delta and underline
+conjugation. What they emit only depends on the shape of
+the box: where it is, how many strands go in and out, and
+the operation's sign. The strands right of the box don't
+change it, so each shape's braids are built once and
+widened to each layer's strand counts when they're used"""
+
+from __future__ import annotations
+from collections import OrderedDict
+from typing import Callable, Dict, Hashable, Tuple
+from layer.layer_emit import LayerEmit
+
+Shape = Tuple[Hashable, ...]
+
+
+class EmitTemplates:
+    """Maps box shapes to the LayerEmit an operation produces
+    for them, counting the hits on each shape"""
+
+    def __init__(self, size: int = 1024) -> None:
+        self.__size = size
+        self.__emits: OrderedDict[Shape, LayerEmit] = OrderedDict()
+        self.__hits: Dict[Shape, int] = {}
+
+    def get(
+        self, shape: Shape, build: Callable[[], LayerEmit], below: int, above: int
+    ) -> LayerEmit:
+        """Looks up the emit for a shape, building it on a miss
+
+        Args:
+            shape (Shape): Operation name and everything about
+            the box its emit depends on
+            build (Callable[[], LayerEmit]): Builds the emit
+            generator by generator
+            below (int): Number of strands below the layer
+            above (int): Number of strands above the layer
+
+        Returns:
+            LayerEmit: Copy of the shape's emit on the layer's
+            strands, safe to mutate
+        """
+        emit = self.__emits.get(shape)
+        if emit is None:
+            emit = build()
+            if self.__size > 0:
+                self.__emits[shape] = emit
+                self.__hits[shape] = 0
+                self.resize(self.__size)
+        else:
+            self.__hits[shape] += 1
+            self.__emits.move_to_end(shape)
+        return emit.widened(below, above)
+
+    def hits(self) -> Dict[Shape, int]:
+        """Getter
+
+        Returns:
+            Dict[Shape, int]: Number of lookups that found each
+            cached shape
+        """
+        return dict(self.__hits)
+
+    def resize(self, size: int) -> None:
+        """Sets the maximum number of shapes, evicting the
+        least recently used ones
+
+        Args:
+            size (int): New maximum; 0 disables caching
+        """
+        self.__size = size
+        while len(self.__emits) > max(size, 0):
+            shape, _ = self.__emits.popitem(last=False)
+            del self.__hits[shape]
+
+    def clear(self) -> None:
+        """Empties the cache and its counters"""
+        self.__emits.clear()
+        self.__hits.clear()
+
+    def __len__(self) -> int:
+        return len(self.__emits)
+
+
+templates = EmitTemplates()
@@ -5,17 +5,18 @@ class and how to canonicalize them into CanonLayers
 """
 
 from __future__ import annotations
-from typing import Callable, Dict, Sequence, Set
+from typing import Callable, Dict, List, Optional, Sequence, Set
 from braid.braid import Braid
 from braid.braid_generator import BraidGenerator
 from category.morphism import Knit
 from category.object import PrimitiveObject
 from common.common import Dir, Sign
 from fig_gen.latex import Latex
+from layer.emit_templates import templates
 from layer.layer_emit import LayerEmit
 
 
-class Layer(Latex):
+class Layer(Latex):  # pylint: disable=too-many-public-methods
     """Layers are a box with a braid
     above and below
     """
@@ -24,6 +25,9 @@ class Layer(Latex):
         self.__left = left
         self.__middle = middle
         self.__id_count = left + right
+        # inverses of the changes made while recording, see
+        # record_undo
+        self.__undos: Optional[List[Callable[[], None]]] = None
 
     def __eq__(self, other: object) -> bool:
         if not isinstance(other, Layer):
@@ -52,6 +56,40 @@ class Layer(Latex):
         l = Layer(self.left(), self.middle().copy(copied_object_dict), self.right())
         return l
 
+    def relink(self, objects: Dict[PrimitiveObject, PrimitiveObject]) -> Layer:
+        """Copies the layer, swapping in the replacement of
+        each object that has one and sharing the rest
+
+        Args:
+            objects (Dict[PrimitiveObject, PrimitiveObject]): Replacement
+            for each replaced object
+
+        Returns:
+            Layer: Relinked layer, or this layer if none of its
+            objects are replaced
+        """
+        middle = self.__middle.relink(objects)
+        if middle is self.__middle:
+            return self
+        return Layer(self.left(), middle, self.right())
+
+    def record_undo(self) -> None:
+        """Starts recording how to reverse the changes that
+        delta, underline_conj and flip_vertical make to this
+        layer. sigma_conj doesn't change the layer"""
+        self.__undos = []
+
+    def take_undo(self) -> List[Callable[[], None]]:
+        """Stops recording and hands over the inverses
+
+        Returns:
+            List[Callable[[], None]]: Inverses of the recorded
+            changes, in the order the changes were made
+        """
+        undos = self.__undos if self.__undos is not None else []
+        self.__undos = None
+        return undos
+
     def __repr__(self) -> str:
         return f"Layer({self.__left}:{repr(self.__middle)}:{self.right()})"
 
@@ -62,7 +100,7 @@ class Layer(Latex):
         Returns:
             int: Number of strands above this layer
         """
-        return self.__id_count + len(self.__middle.outs())
+        return self.__id_count + self.__middle.n_outs()
 
     def n_below(self) -> int:
         """Calculates how many strands are below
@@ -71,7 +109,7 @@ class Layer(Latex):
         Returns:
             int: Number of strands below this layer
         """
-        return self.__id_count + len(self.__middle.ins())
+        return self.__id_count + self.__middle.n_ins()
 
     def left(self) -> int:
         """Getter
@@ -109,7 +147,7 @@ class Layer(Latex):
         for i in range(self.n_above()):
             if i < self.__left:
                 keep.add(i)
-            elif i >= self.__left + len(self.__middle.outs()):
+            elif i >= self.__left + self.__middle.n_outs():
                 keep.add(i)
         keep.add(self.__left + self.__middle.primary_index())
 
@@ -151,29 +189,60 @@ class Layer(Latex):
             LayerEmit: Emitted braids from
             this op
         """
-        emit = self.identity_emit()
+        return self.delta_power(1 if sign.pos() else -1)
+
+    def delta_power(self, k: int) -> LayerEmit:
+        """Delta conjugates the box k times in one go. The
+        knit is flipped by parity, twists are added up and
+        the half twists are emitted as powers
 
-        self.__middle.flip()
+        Args:
+            k (int): Number of deltas above the box, negative
+            for negative deltas
+
+        Returns:
+            LayerEmit: Emitted braids from
+            this op
+        """
+        if k == 0:
+            return self.identity_emit()
+        pos = k > 0
+        self.__twist(k)
+        if self.__undos is not None:
+            self.__undos.append(lambda: self.__twist(-k))
         i = self.__left
-        n = len(self.__middle.outs())
-        for j in range(n):
-            o = self.__middle.outs()[j]
-            o.twist(sign.pos())
-        for j in range(i, i + n):
-            # take strand i to index j
-            for k in range(j - 1, i - 1, -1):
-                emit.emit_above(BraidGenerator(k, sign.pos()))
-
-        m = len(self.__middle.ins())
-        for j in range(m):
-            o = self.__middle.ins()[j]
-            o.twist(not sign.pos())
-        for j in range(i + m - 1, i - 1, -1):
-            # take strand i to index j
-            for k in range(i, j):
-                emit.emit_below(BraidGenerator(k, not sign.pos()))
+        n = self.__middle.n_outs()
+        m = self.__middle.n_ins()
+
+        def build() -> LayerEmit:
+            emit = self.identity_emit()
+            for j in range(i, i + n):
+                # take strand i to index j
+                for g in range(j - 1, i - 1, -1):
+                    emit.emit_above(BraidGenerator.get(g, pos))
+            for j in range(i + m - 1, i - 1, -1):
+                # take strand i to index j
+                for g in range(i, j):
+                    emit.emit_below(BraidGenerator.get(g, not pos))
+            return emit
+
+        shape = ("delta", i, m, n, pos)
+        emit = templates.get(shape, build, self.n_below(), self.n_above())
+        return emit if abs(k) == 1 else emit.repeat(abs(k))
+
+    def __twist(self, k: int) -> None:
+        """Turns the box over k times, flipping the knit by
+        parity and twisting the objects going in and out
 
-        return emit
+        Args:
+            k (int): Number of half turns
+        """
+        if k % 2 != 0:
+            self.__middle.flip()
+        for o in self.__middle.true_outs():
+            o.twist_by(k)
+        for o in self.__middle.true_ins():
+            o.twist_by(-k)
 
     def sigma_conj(self, i: int, sign: Sign) -> LayerEmit:
         """Performs the sigma conjugation rule on either
@@ -197,12 +266,12 @@ class Layer(Latex):
             above_i = i
             below_i = i
         else:
-            above_i = i + len(self.__middle.outs()) - 1
-            below_i = i + len(self.__middle.ins()) - 1
+            above_i = i + self.__middle.n_outs() - 1
+            below_i = i + self.__middle.n_ins() - 1
 
         emit = self.identity_emit()
-        emit.emit_above(BraidGenerator(above_i, sign.pos()))
-        emit.emit_below(BraidGenerator(below_i, not sign.pos()))
+        emit.emit_above(BraidGenerator.get(above_i, sign.pos()))
+        emit.emit_below(BraidGenerator.get(below_i, not sign.pos()))
 
         return emit
 
@@ -221,39 +290,53 @@ class Layer(Latex):
             this op
         """
         i = self.__left
-        n = len(self.__middle.outs())
-        m = len(self.__middle.ins())
-
-        emit = self.identity_emit()
-        match d.right():
-            case False:
-                sign = not above
-                for j in range(i - 1, i + n - 1):
-                    emit.emit_above(BraidGenerator(j, sign))
-
-                sign = not sign
-                for j in range(i - 1, i + m - 1):
-                    emit.emit_below(BraidGenerator(j, sign))
-
-                self.__left -= 1
-            case True:
-                sign = above
-                for j in range(i + n - 1, i - 1, -1):
-                    emit.emit_above(BraidGenerator(j, sign))
-
-                sign = not sign
-                for j in range(i + m - 1, i - 1, -1):
-                    emit.emit_below(BraidGenerator(j, sign))
+        n = self.__middle.n_outs()
+        m = self.__middle.n_ins()
+
+        def build() -> LayerEmit:
+            emit = self.identity_emit()
+            match d.right():
+                case False:
+                    sign = not above
+                    for j in range(i - 1, i + n - 1):
+                        emit.emit_above(BraidGenerator.get(j, sign))
+
+                    sign = not sign
+                    for j in range(i - 1, i + m - 1):
+                        emit.emit_below(BraidGenerator.get(j, sign))
+                case True:
+                    sign = above
+                    for j in range(i + n - 1, i - 1, -1):
+                        emit.emit_above(BraidGenerator.get(j, sign))
+
+                    sign = not sign
+                    for j in range(i + m - 1, i - 1, -1):
+                        emit.emit_below(BraidGenerator.get(j, sign))
+            return emit
+
+        shape = ("underline", i, m, n, d.right(), above)
+        emit = templates.get(shape, build, self.n_below(), self.n_above())
+        step = 1 if d.right() else -1
+        self.__left += step
+        if self.__undos is not None:
+            self.__undos.append(lambda: self.__shift(-step))
+        return emit
 
-                self.__left += 1
+    def __shift(self, step: int) -> None:
+        """Moves the box right by step strands
 
-        return emit
+        Args:
+            step (int): Strands to move by, negative for left
+        """
+        self.__left += step
 
     def flip_vertical(self) -> None:
         """Flips this layer upside down
         (not rotated, instead reflected)
         """
         self.__middle = self.middle().flip_vertical()
+        if self.__undos is not None:
+            self.__undos.append(self.flip_vertical)
         # return Layer(self.left(), self.middle().flip_vertical(), self.right())
 
     def flip_macro(self, below: Braid) -> LayerEmit:
@@ -288,9 +371,9 @@ class Layer(Latex):
         """
         i = self.left()
         j = above.left()
-        m = len(self.middle().outs())
-        p = len(above.middle().ins())
-        q = len(above.middle().outs())
+        m = self.middle().n_outs()
+        p = above.middle().n_ins()
+        q = above.middle().n_outs()
         if i + m <= j or j + p <= i:
             above.move_below(self)
             if i + m <= j:
@@ -313,15 +396,15 @@ class Layer(Latex):
             below (Layer): Layer to move below
         """
         i = below.left()
-        n = len(below.middle().ins())
-        m = len(below.middle().outs())
+        n = below.middle().n_ins()
+        m = below.middle().n_outs()
         j = self.left()
 
         if i + m <= j:
             self.__left = j + n - m
             self.__id_count += n - m
             return
-        p = len(self.middle().ins())
+        p = self.middle().n_ins()
         if j + p <= i:
             self.__id_count += n - m
             return
@@ -351,11 +434,7 @@ class Layer(Latex):
             LayerEmit: Emitted braids from
             this op
         """
-        emit = self.identity_emit()
-        while self.primary_twists() != 0:
-            sign = self.primary_twists() < 0
-            emit.extend(self.delta(Sign(sign)))
-        return emit
+        return self.delta_power(-self.primary_twists())
 
     def macro_step(self, above: Braid) -> LayerEmit:
         """Performs the macro step of the algorithm
@@ -388,7 +467,7 @@ class Layer(Latex):
             op
         """
         emit = self.identity_emit()
-        num_macro_strands = self.n_below() - len(self.__middle.ins()) + 1
+        num_macro_strands = self.n_below() - self.__middle.n_ins() + 1
         for _ in range(steps):
             r = rng()
             if r < 0.3:
@@ -405,7 +484,7 @@ class Layer(Latex):
                     if self.__left == 0:
                         continue
                 else:
-                    if self.__left + len(self.__middle.ins()) == self.n_below():
+                    if self.__left + self.__middle.n_ins() == self.n_below():
                         continue
 
                 emit.extend(self.underline_conj(Dir(right), rng() < 0.5))
@@ -418,9 +497,9 @@ class Layer(Latex):
         str_latex = ""
         box_height = self.__middle.latex_height()
 
-        if len(self.__middle.ins()) < len(self.__middle.outs()):
+        if self.__middle.n_ins() < self.__middle.n_outs():
             # like a tuck. Draw curves below
-            straights_offset = len(self.__middle.ins()) if self.__middle.dir() == Dir(True) else 0
+            straights_offset = self.__middle.n_ins() if self.__middle.dir() == Dir(True) else 0
             # straights
             for i in range(self.__left + straights_offset):
                 o = context[i]
@@ -436,14 +515,14 @@ class Layer(Latex):
                 for j in range(box_height):
                     str_latex += f"""\\identity{{{
                         x+i if j == 0 else
-                        x + i + len(self.__middle.outs()) - len(self.__middle.ins())}}}{{{y+j}}}
-{{{len(self.__middle.outs()) - len(self.__middle.ins()) if j == 0 else 0}}}
+                        x + i + self.__middle.n_outs() - self.__middle.n_ins()}}}{{{y+j}}}
+{{{self.__middle.n_outs() - self.__middle.n_ins() if j == 0 else 0}}}
 {{{o}}}{{{r}}}{{{g}}}{{{b}}}\n"""
             y += 1
 
         # now draw box
         # straights on left
-        box_context_in = context[self.__left : self.__left + len(self.__middle.ins())]
+        box_context_in = context[self.__left : self.__left + self.__middle.n_ins()]
         str_latex += self.__middle.to_latex(x + self.__left, y, box_context_in)
         for i in range(self.__left):
             o = context[i]
@@ -454,18 +533,18 @@ class Layer(Latex):
                 )
 
         # straights on right
-        for i in range(self.__left + len(self.__middle.ins()), len(context)):
+        for i in range(self.__left + self.__middle.n_ins(), len(context)):
             o = context[i]
             (r, g, b) = o.color()
             for j in range(box_height):
                 str_latex += f"""\\identity{{{
-                    x + i + len(self.__middle.outs()) - len(self.__middle.ins())}}}{{{y+j}}}
+                    x + i + self.__middle.n_outs() - self.__middle.n_ins()}}}{{{y+j}}}
 {{{0}}}{{{o}}}{{{r}}}{{{g}}}{{{b}}}\n"""
         y += 1
 
-        if len(self.__middle.ins()) > len(self.__middle.outs()):
+        if self.__middle.n_ins() > self.__middle.n_outs():
             # anti-tuck. Draw curves above
-            straights_offset = len(self.__middle.outs()) if self.__middle.dir() == Dir(True) else 0
+            straights_offset = self.__middle.n_outs() if self.__middle.dir() == Dir(True) else 0
             # straights
             for i in range(self.__left + straights_offset):
                 o = context[i]
@@ -475,14 +554,14 @@ class Layer(Latex):
                         f"\\identity{{{x+i}}}{{{y+j}}}{{{0}}}{{{o}}}{{{r}}}{{{g}}}{{{b}}}\n"
                     )
             # curves
-            for i in range(self.__left + straights_offset, len(context) - len(self.__middle.ins()) + len(self.__middle.outs())):
+            for i in range(self.__left + straights_offset, len(context) - self.__middle.n_ins() + self.__middle.n_outs()):
                 o = context[i]
                 (r, g, b) = o.color()
                 for j in range(box_height):
                     str_latex += f"""\\identity{{{
                         x+i if j == 0 else
-                        x + i + len(self.__middle.outs()) - len(self.__middle.ins())}}}{{{y+j}}}
-{{{len(self.__middle.outs()) - len(self.__middle.ins()) if j == 0 else 0}}}
+                        x + i + self.__middle.n_outs() - self.__middle.n_ins()}}}{{{y+j}}}
+{{{self.__middle.n_outs() - self.__middle.n_ins() if j == 0 else 0}}}
 {{{o}}}{{{r}}}{{{g}}}{{{b}}}\n"""
             y += 1
 
@@ -490,16 +569,16 @@ class Layer(Latex):
 
     def latex_height(self) -> int:
         knit_height = self.__middle.latex_height()
-        if len(self.__middle.ins()) != len(self.__middle.outs()):
+        if self.__middle.n_ins() != self.__middle.n_outs():
             return knit_height + 1
         return knit_height
 
     def context_out(
         self, context: Sequence[PrimitiveObject]
     ) -> Sequence[PrimitiveObject]:
-        box_context_in = context[self.__left : self.__left + len(self.__middle.ins())]
+        box_context_in = context[self.__left : self.__left + self.__middle.n_ins()]
         return (
             list(context[: self.__left])
             + list(self.__middle.context_out(box_context_in))
-            + list(context[self.__left + len(self.__middle.ins()) :])
+            + list(context[self.__left + self.__middle.n_ins() :])
         )
@@ -1,17 +1,102 @@
 """Class to represent the emittances from layer operations"""
 
 from __future__ import annotations
+from array import array
+from collections import deque
+from typing import Deque
 from braid.braid import Braid
 from braid.braid_generator import BraidGenerator
 
 
+class _Segments:
+    """A braid word kept as a log of segments, so that words
+    can be added at either end without copying them. The word
+    is the reversed head, then the segments, then the tail.
+    Segments are shared, so they're never mutated"""
+
+    def __init__(self) -> None:
+        self.__head = array("h")
+        self.__segments: Deque[array[int]] = deque()
+        self.__tail = array("h")
+
+    def copy(self) -> _Segments:
+        """Copies the log without copying the segments
+
+        Returns:
+            _Segments: Copy
+        """
+        # pylint: disable=protected-access,unused-private-member
+        s = _Segments()
+        s.__head = array("h", self.__head)
+        s.__segments = deque(self.__segments)
+        s.__tail = array("h", self.__tail)
+        return s
+
+    def prepend(self, g: int) -> None:
+        """Puts a generator, in sage encoding, at the start"""
+        self.__head.append(g)
+
+    def append(self, g: int) -> None:
+        """Puts a generator, in sage encoding, at the end"""
+        self.__tail.append(g)
+
+    def prepend_word(self, word: array[int]) -> None:
+        """Puts a word that won't be mutated at the start"""
+        if self.__head:
+            self.__segments.appendleft(self.__head[::-1])
+            self.__head = array("h")
+        self.__segments.appendleft(word)
+
+    def append_word(self, word: array[int]) -> None:
+        """Puts a word that won't be mutated at the end"""
+        if self.__tail:
+            self.__segments.append(self.__tail)
+            self.__tail = array("h")
+        self.__segments.append(word)
+
+    def word(self) -> array[int]:
+        """Materializes the word, collapsing the log into one
+        segment. Don't mutate the result
+
+        Returns:
+            array[int]: Generators in sage encoding
+        """
+        if self.__head or self.__tail or len(self.__segments) != 1:
+            word = self.__head[::-1]
+            for segment in self.__segments:
+                word.extend(segment)
+            word.extend(self.__tail)
+            self.__head = array("h")
+            self.__segments = deque([word])
+            self.__tail = array("h")
+        return self.__segments[0]
+
+
 class LayerEmit:
     """Records the below and above braids. Can be extended
-    with other LayerEmits to concatenate their operations"""
+    with other LayerEmits to concatenate their operations.
+    Braids are logged as segments and only built when
+    applied; flipping vertically just toggles how the
+    log is read"""
 
     def __init__(self, below: int, above: int) -> None:
-        self.__below = Braid(below)
-        self.__above = Braid(above)
+        self.__n_below = below
+        self.__n_above = above
+        # the below and above words, or when flipped, the
+        # above and below words read backwards
+        self.__lower = _Segments()
+        self.__upper = _Segments()
+        self.__flipped = False
+
+    def __below_word(self) -> array[int]:
+        if self.__flipped:
+            return self.__upper.word()[::-1]
+        return self.__lower.word()
+
+    def __above_word(self) -> array[int]:
+        if self.__flipped:
+            return self.__lower.word()[::-1]
+        return self.__upper.word()
 
     def above(self) -> Braid:
         """Getter
@@ -19,7 +104,7 @@ class LayerEmit:
         Returns:
             Braid: above braid
         """
-        return self.__above
+        return Braid.from_word(self.__n_above, self.__above_word())
 
     def below(self) -> Braid:
         """Getter
@@ -27,7 +112,7 @@ class LayerEmit:
         Returns:
             Braid: below braid
         """
-        return self.__below
+        return Braid.from_word(self.__n_below, self.__below_word())
 
     def emit_above(self, g: BraidGenerator) -> None:
         """Emits a generator above the layer
@@ -35,7 +120,10 @@ class LayerEmit:
         Args:
             g (BraidGenerator): Generator to be emitted
         """
-        self.__above.prepend(g)
+        if self.__flipped:
+            self.__lower.append(g.to_sage())
+        else:
+            self.__upper.prepend(g.to_sage())
 
     def emit_below(self, g: BraidGenerator) -> None:
         """Emits a generator below the layer
@@ -43,7 +131,10 @@ class LayerEmit:
         Args:
             g (BraidGenerator): Generator to be emitted
         """
-        self.__below.append(g)
+        if self.__flipped:
+            self.__upper.prepend(g.to_sage())
+        else:
+            self.__lower.append(g.to_sage())
 
     def extend(self, next_emit: LayerEmit) -> None:
         """Adds the supplied LayerEmit to this one,
@@ -54,7 +145,15 @@ class LayerEmit:
             next_emit (LayerEmit): LayerEmit that was emitted
             second
         """
-        next_emit.apply(self.__below, self.__above)
+        # pylint: disable=protected-access
+        below = next_emit.__below_word()
+        above = next_emit.__above_word()
+        if self.__flipped:
+            self.__upper.prepend_word(below[::-1])
+            self.__lower.append_word(above[::-1])
+        else:
+            self.__lower.append_word(below)
+            self.__upper.prepend_word(above)
 
     def apply(self, below: Braid, above: Braid) -> None:
         """Applies this layer emittance to braids
@@ -66,6 +165,53 @@ class LayerEmit:
         below.extend(self.below())
         above.intend(self.above())
 
+    def copy(self) -> LayerEmit:
+        """Copies the emitted braids
+
+        Returns:
+            LayerEmit: Copy
+        """
+        # pylint: disable=protected-access,unused-private-member
+        emit = LayerEmit(self.__n_below, self.__n_above)
+        emit.__lower = self.__lower.copy()
+        emit.__upper = self.__upper.copy()
+        emit.__flipped = self.__flipped
+        return emit
+
+    def widened(self, below: int, above: int) -> LayerEmit:
+        """Copies the emitted braids onto other strand counts.
+        Generators keep their indices, so the new counts have
+        to be wide enough for them
+
+        Args:
+            below (int): Number of strands below the layer
+            above (int): Number of strands above the layer
+
+        Returns:
+            LayerEmit: Copy
+        """
+        # pylint: disable=protected-access,unused-private-member
+        emit = self.copy()
+        emit.__n_below = below
+        emit.__n_above = above
+        return emit
+
+    def repeat(self, k: int) -> LayerEmit:
+        """Computes the emit of doing the op
+        that emitted this k times in a row
+
+        Args:
+            k (int): Number of repetitions, at least 0
+
+        Returns:
+            LayerEmit: Emit of the repeated op
+        """
+        # pylint: disable=protected-access
+        emit = LayerEmit(self.__n_below, self.__n_above)
+        emit.__lower.append_word(self.__below_word() * k)
+        emit.__upper.append_word(self.__above_word() * k)
+        return emit
+
     def flip_vertical(self) -> LayerEmit:
         """Flips this LayerEmit vertically
         (reflection, not rotation)
@@ -73,9 +219,8 @@ class LayerEmit:
         Returns:
             LayerEmit: vertically flipped LayerEmit
         """
-        flipped = LayerEmit(self.above().n(), self.below().n())
-        for g in reversed(list(self.__above)):  # reads outside to in
-            flipped.emit_below(g)
-        for g in self.__below:  # outside to in
-            flipped.emit_above(g)
+        # pylint: disable=protected-access,unused-private-member
+        flipped = self.copy()
+        flipped.__n_below, flipped.__n_above = self.__n_above, self.__n_below
+        flipped.__flipped = not self.__flipped
         return flipped
@@ -1,24 +1,55 @@
 """Class to wrap around a layer and apply its emittances"""
 
 from __future__ import annotations
-from typing import Callable
+from typing import Callable, Optional
 from braid.braid import Braid
 from common.common import Dir, Sign
 from layer.layer import Layer
 from layer.layer_emit import LayerEmit
+from layer.undo import UndoLog
 
 
 class LayerWrapper:
     """Stores below and above braids. Exposes some
-    equivalence-preserving layer operations"""
+    equivalence-preserving layer operations. Given an
+    UndoLog, records how to reverse each operation in it"""
 
-    def __init__(self, below: Braid, layer: Layer, above: Braid) -> None:
+    def __init__(
+        self, below: Braid, layer: Layer, above: Braid, log: Optional[UndoLog] = None
+    ) -> None:
         self.__below = below
         self.__layer = layer
         self.__above = above
+        self.__log = log
 
-    def __apply(self, emit: LayerEmit) -> None:
-        emit.apply(self.__below, self.__above)
+    def __apply(self, op: Callable[[], LayerEmit]) -> None:
+        """Runs a layer operation and applies what it emits
+
+        Args:
+            op (Callable[[], LayerEmit]): Operation on the layer
+        """
+        if self.__log is None:
+            op().apply(self.__below, self.__above)
+            return
+        below, above, layer = self.__below, self.__above, self.__layer
+        layer.record_undo()
+        try:
+            emit = op()
+        finally:
+            undos = layer.take_undo()
+        n_below = len(below)
+        n_above = len(above)
+        emit.apply(below, above)
+        n_below = len(below) - n_below
+        n_above = len(above) - n_above
+
+        def undo() -> None:
+            below.drop_last(n_below)
+            above.drop_first(n_above)
+            for u in reversed(undos):
+                u()
+
+        self.__log.record(undo)
 
     def fuzz(self, rng: Callable[[], float], steps: int) -> None:
         """Fuzzes this layer by performing layer operations; doesn't
@@ -28,45 +59,56 @@ class LayerWrapper:
             rng (Callable[[], float]): Random number generator
             steps (int): Number of mutations to attempt
         """
-        self.__apply(self.__layer.fuzz(rng, steps))
+        self.__apply(lambda: self.__layer.fuzz(rng, steps))
 
     def macro_step(self) -> None:
         """Performs the macro step of the algorithm
         on this layer, mutating it in place
         """
-        self.__apply(self.__layer.macro_step(self.__above))
+        self.__apply(lambda: self.__layer.macro_step(self.__above))
 
     def sigma_conj(self, i: int, sign: Sign) -> None:
         """See Layer's sigma_conj"""
-        self.__apply(self.__layer.sigma_conj(i, sign))
+        self.__apply(lambda: self.__layer.sigma_conj(i, sign))
 
     def underline_conj(self, d: Dir, above: bool) -> None:
         """See Layer's underline_conj"""
-        self.__apply(self.__layer.underline_conj(d, above))
+        self.__apply(lambda: self.__layer.underline_conj(d, above))
 
     def delta_step(self) -> None:
         """Performs the delta step of the algorithm
         on this layer, mutating it in place
         """
-        self.__apply(self.__layer.delta_step())
+        self.__apply(self.__layer.delta_step)
 
     def delta(self, sign: Sign) -> None:
         """See Layer's delta"""
-        self.__apply(self.__layer.delta(sign))
+        self.__apply(lambda: self.__layer.delta(sign))
 
     def canonicalize(self) -> None:
         """Canonicalizes this layer, mutating
         it in place. Also canonicalizes the above
         braid
         """
-        self.__apply(self.__layer.canonicalize(self.__above))
+        self.canonicalize_layer()
+        if self.__log is not None:
+            above = self.__above
+            old = above.copy()
+            self.__log.record(lambda: above.reset_to(old))
         self.__above.set_canon()
 
+    def canonicalize_layer(self) -> None:
+        """Canonicalizes this layer, mutating
+        it in place. Leaves the above braid
+        uncanonicalized
+        """
+        self.__apply(lambda: self.__layer.canonicalize(self.__above))
+
     def flip_macro(self) -> None:
         """Does the macro substep of canonicalization
         on this layer while "facing upside down"
         """
-        self.__apply(self.__layer.flip_macro(self.__below))
+        self.__apply(lambda: self.__layer.flip_macro(self.__below))
 
     def macro_subbraid(self) -> Braid:
         """Computes the above macro subbraid of this
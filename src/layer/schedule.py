@@ -0,0 +1,161 @@
+"""Orders layers that can move past each other. Two adjacent
+layers with the identity braid between them swap when their
+strands don't overlap (see Layer.swap), so a run of layers
+with identity braids between them is a partial order: each
+layer has to stay above the layers whose strands it takes
+in, or whose strands surround it.
+
+The canonical order takes the leftmost layer that's free
+to go next. Left and right are read off one left-to-right
+order of every strand the run ever has: a layer's new
+strands go just right of the last strand it takes in, or
+just right of the strand to its left if it takes none in.
+Moving layers past each other doesn't change that order,
+so every ordering of the run gets the same canonical one."""
+
+from __future__ import annotations
+import heapq
+from typing import Dict, List, Sequence
+from layer.layer import Layer
+
+# Stands in for the strand left of every other strand
+_START = -1
+
+
+def dependencies(layers: Sequence[Layer]) -> List[List[int]]:
+    """Finds the layers each layer can't move below
+
+    Args:
+        layers (Sequence[Layer]): Layers from the bottom up, with
+        identity braids between them
+
+    Returns:
+        List[List[int]]: For each layer, the indices of the
+        layers directly below it that it depends on
+    """
+    if not layers:
+        return []
+    n = layers[0].n_below()
+    # the layer that made the strand at each position, and the
+    # layer whose strands surround each gap between positions
+    strands = [-1] * n
+    gaps = [-1] * (n + 1)
+    below: List[List[int]] = []
+    for k, l in enumerate(layers):
+        j = l.left()
+        p = l.middle().n_ins()
+        q = l.middle().n_outs()
+        if p > 0:
+            found = set(strands[j : j + p])
+        else:
+            found = {gaps[j]}
+        found.discard(-1)
+        below.append(sorted(found))
+        strands[j : j + p] = [k] * q
+        gaps[j : j + p + 1] = [gaps[j]] + [k] * (q - 1) + [gaps[j + p]]
+    return below
+
+
+def strand_ranks(layers: Sequence[Layer]) -> List[int]:
+    """Ranks each layer by where its first out strand is in
+    the left-to-right order of all the run's strands
+
+    Args:
+        layers (Sequence[Layer]): Layers from the bottom up, with
+        identity braids between them
+
+    Returns:
+        List[int]: Rank of each layer; smaller is further left
+    """
+    if not layers:
+        return []
+    n = layers[0].n_below()
+    # the strands as a linked list, next_strand[s] being the
+    # strand after s in the order
+    next_strand: Dict[int, int] = {}
+    current = list(range(n))
+    last = _START
+    for s in current:
+        next_strand[last] = s
+        last = s
+    firsts: List[int] = []
+    for l in layers:
+        j = l.left()
+        p = l.middle().n_ins()
+        q = l.middle().n_outs()
+        if p > 0:
+            anchor = current[j + p - 1]
+        else:
+            anchor = current[j - 1] if j > 0 else _START
+        made = list(range(n, n + q))
+        n += q
+        firsts.append(made[0])
+        for s in reversed(made):
+            if anchor in next_strand:
+                next_strand[s] = next_strand[anchor]
+            next_strand[anchor] = s
+        current[j : j + p] = made
+    rank: Dict[int, int] = {}
+    s = _START
+    while s in next_strand:
+        s = next_strand[s]
+        rank[s] = len(rank)
+    return [rank[s] for s in firsts]
+
+
+def canonical_order(layers: Sequence[Layer]) -> List[int]:
+    """Orders the layers so that each one is above the layers
+    it depends on, taking the leftmost free layer each time
+
+    Args:
+        layers (Sequence[Layer]): Layers from the bottom up, with
+        identity braids between them
+
+    Returns:
+        List[int]: Indices of the layers, from the bottom up
+    """
+    below = dependencies(layers)
+    ranks = strand_ranks(layers)
+    waiting = [len(deps) for deps in below]
+    above: List[List[int]] = [[] for _ in layers]
+    for k, deps in enumerate(below):
+        for d in deps:
+            above[d].append(k)
+    free = [(ranks[k], k) for k, count in enumerate(waiting) if count == 0]
+    heapq.heapify(free)
+    order: List[int] = []
+    while free:
+        _, k = heapq.heappop(free)
+        order.append(k)
+        for a in above[k]:
+            waiting[a] -= 1
+            if waiting[a] == 0:
+                heapq.heappush(free, (ranks[a], a))
+    return order
+
+
+def swap_sequence(order: Sequence[int]) -> List[int]:
+    """Finds the fewest swaps of adjacent layers that put
+    layers in the given order, one per pair of layers that
+    the order puts the other way round. That takes time
+    linear in the run plus the number of those pairs, which
+    is quadratic when the order reverses the run
+
+    Args:
+        order (Sequence[int]): Indices of the layers in the
+        order they should end up
+
+    Returns:
+        List[int]: For each swap, the index of the lower of
+        the two layers swapped
+    """
+    current = list(range(len(order)))
+    position = list(range(len(order)))
+    swaps: List[int] = []
+    for target, k in enumerate(order):
+        for i in range(position[k], target, -1):
+            other = current[i - 1]
+            current[i - 1], current[i] = k, other
+            position[k], position[other] = i - 1, i
+            swaps.append(i - 1)
+    return swaps
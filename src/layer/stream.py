@@ -0,0 +1,65 @@
+"""Canonicalizes a word given as a stream of braids and
+layers, without holding the whole word in memory.
+
+Canonicalization runs from the top of a word down: a layer
+reads the braid above it and emits generators into both of
+its braids. So the stream is read top-down, the reverse of
+Word's iteration order, and a braid is final as soon as the
+layer below it is canonical. Only that braid and the
+generators emitted below the last layer are kept."""
+
+from typing import Iterable, Iterator, Optional, Union
+from braid.braid import Braid
+from layer.layer import Layer
+
+
+def canonicalize_stream(
+    items: Iterable[Union[Braid, Layer]]
+) -> Iterator[Union[Braid, Layer]]:
+    """Canonicalizes a word read from the top down, yielding
+    each braid and layer once it is canonical. The items are
+    mutated in place and yielded themselves
+
+    Args:
+        items (Iterable[Union[Braid, Layer]]): The word's braids and
+        layers from the top down, starting and ending with a braid
+
+    Raises:
+        StreamOrderException: when braids and layers don't alternate
+
+    Yields:
+        Iterator[Union[Braid, Layer]]: The canonical word, top down
+    """
+    above: Optional[Braid] = None
+    # generators emitted below the last layer, to go on
+    # top of the next braid
+    carry: Optional[Braid] = None
+    for item in items:
+        if isinstance(item, Braid):
+            if above is not None:
+                raise StreamOrderException()
+            if carry is not None:
+                item.extend(carry)
+            above = item
+        else:
+            if above is None:
+                raise StreamOrderException()
+            emit = item.canonicalize(above)
+            carry = Braid(item.n_below())
+            emit.apply(carry, above)
+            above.set_canon()
+            yield above
+            yield item
+            above = None
+    if above is None:
+        raise StreamOrderException()
+    above.set_canon()
+    yield above
+
+
+class StreamOrderException(Exception):
+    """
+    Raised when a stream doesn't alternate
+    between braids and layers, starting and
+    ending with a braid
+    """
@@ -0,0 +1,45 @@
+"""Undo logs for trying out layer operations on a word and
+taking them back. Each change records how to reverse just
+itself, so rolling back costs as much as the changes did
+rather than a copy of the whole word."""
+
+from __future__ import annotations
+from typing import Callable, List
+
+
+class UndoLog:
+    """Inverse operations, undone last first"""
+
+    def __init__(self) -> None:
+        self.__undos: List[Callable[[], None]] = []
+
+    def record(self, undo: Callable[[], None]) -> None:
+        """Records how to reverse a change
+
+        Args:
+            undo (Callable[[], None]): Reverses the change,
+            assuming every later change was reversed already
+        """
+        self.__undos.append(undo)
+
+    def rollback(self, to: int = 0) -> None:
+        """Reverses recorded changes, latest first, and
+        forgets them
+
+        Args:
+            to (int, optional): Number of the earliest changes to
+            keep, such as an earlier len of the log. Defaults to 0.
+        """
+        while len(self.__undos) > to:
+            self.__undos.pop()()
+
+    def __len__(self) -> int:
+        return len(self.__undos)
+
+
+class TransactionException(Exception):
+    """
+    Raised when a word starts a transaction
+    while in one, ends one while not in one,
+    or is copied in the middle of one
+    """
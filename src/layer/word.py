@@ -5,21 +5,26 @@ starts the description of the algorithm to
 canonicalize a word."""
 
 from __future__ import annotations
-from typing import Callable, Sequence, Union
+from typing import TYPE_CHECKING, Callable, Iterator, Optional, Sequence, Union, cast
 from braid.braid import Braid, StrandMismatchException
 from category.object import PrimitiveObject
 from fig_gen.latex import Latex
+from layer.components import Components
+from layer.connections import Connections
 from layer.layer import Layer
 from layer.layer_wrapper import LayerWrapper
+from layer import schedule
+from layer.undo import TransactionException, UndoLog
 
+if TYPE_CHECKING:
+    from concurrent.futures import Future
 
-class Word(Latex):
+
+class Word(Latex):  # pylint: disable=too-many-public-methods,too-many-instance-attributes
     """Words are a list of Layers and the
     Braids between them"""
 
     def __init__(self, bottom_strands: int = 0) -> None:
-        # TODO: the connections of PrimitiveObjects between layers
-        # is a graph structure. Leverage that?
         self.__layers: list[Layer] = []
         self.__braids: list[Braid] = [Braid(bottom_strands)]
         self.__iter_index = 0
@@ -28,6 +33,24 @@ class Word(Latex):
         # braids[i+1] is above.
         # len(braids) = len(layers) + 1 always
 
+        # whether each layer and braid belongs to this word
+        # alone; shared ones are copied before they change
+        self.__own_layers: list[bool] = []
+        self.__own_braids: list[bool] = [True]
+        # this word's copies of objects it shared with other
+        # words. Objects it owns map to themselves
+        self.__clones: dict[PrimitiveObject, PrimitiveObject] = {}
+        # the layers each object comes out of and goes into
+        self.__connections = Connections()
+        # how to reverse the changes made in a transaction, and
+        # the dirty index from before it
+        self.__log: Optional[UndoLog] = None
+        self.__log_dirty = -1
+
+        # braids[dirty + 1:] and layers[dirty:] are canonical
+        # and haven't changed since; -1 when the whole word is
+        self.__dirty = -1
+
         # Whether zero-length braids at the top and
         # bottom are drawn or not
         self.__draw_preamble = 1
@@ -36,22 +59,87 @@ class Word(Latex):
         self.labels_out: Sequence[str] = []
 
     def copy(self) -> Word:
-        """Copies the word and
-        its layers.
+        """Copies the word. The braids, layers and objects
+        are shared until either word changes them, so only
+        the lists of them are copied here
+
+        Raises:
+            TransactionException: when in a transaction
 
         Returns:
-            Word: Not-shallow
-            copy
+            Word: Copy that behaves as a deep copy
         """
+        # pylint: disable=protected-access,unused-private-member
+        if self.__log is not None:
+            # the log holds this word's braids and layers, which
+            # the copy would share
+            raise TransactionException()
+        if self.__clones:
+            # leave no layer pointing at an object this word
+            # replaced, so every object not cloned is shared
+            for i in range(len(self.__layers)):
+                self.__layer(i)
+            self.__clones = {}
         w = Word(self.__braids[0].n())  # guaranteed at least one braid
-        copied_object_dict: dict[PrimitiveObject, PrimitiveObject] = {}
-        for i, l in enumerate(self.__layers):
-            below_braid = self.__braids[i]
-            w.append_braid(below_braid.copy())
-            w.append_layer(l.copy(copied_object_dict))
-        w.append_braid(self.__braids[-1])
+        w.__layers = list(self.__layers)
+        w.__braids = list(self.__braids)
+        self.__own_layers = [False] * len(self.__layers)
+        self.__own_braids = [False] * len(self.__braids)
+        w.__own_layers = list(self.__own_layers)
+        w.__own_braids = list(self.__own_braids)
+        w.__connections = self.__connections.copy()
+        w.__dirty = self.__dirty
         return w
 
+    def __layer(self, index: int) -> Layer:
+        """Reads the layer at this index, pointing it at this
+        word's copies of the objects it shares
+
+        Args:
+            index (int): Index in the layers list
+
+        Returns:
+            Layer: Layer, which mustn't be mutated
+        """
+        if not self.__own_layers[index] and self.__clones:
+            self.__layers[index] = self.__layers[index].relink(self.__clones)
+        return self.__layers[index]
+
+    def __own_layer(self, index: int) -> Layer:
+        """Copies the layer at this index and its objects if
+        they're shared, so they can be mutated
+
+        Args:
+            index (int): Index in the layers list
+
+        Returns:
+            Layer: Layer owned by this word
+        """
+        if not self.__own_layers[index]:
+            old = self.__layers[index]
+            l = old.copy(self.__clones)
+            for o in l.middle().true_ins() + l.middle().true_outs():
+                self.__clones[o] = o
+            self.__connections.replace(old, l)
+            self.__layers[index] = l
+            self.__own_layers[index] = True
+        return self.__layers[index]
+
+    def __own_braid(self, index: int) -> Braid:
+        """Copies the braid at this index if it's shared,
+        so it can be mutated
+
+        Args:
+            index (int): Index in the braids list
+
+        Returns:
+            Braid: Braid owned by this word
+        """
+        if not self.__own_braids[index]:
+            self.__braids[index] = self.__braids[index].copy()
+            self.__own_braids[index] = True
+        return self.__braids[index]
+
     def layer_at(self, index: int) -> LayerWrapper:
         """Returns a wrapper around the layer at this
         index. The wrapper applies any emitted effects
@@ -63,8 +151,13 @@ class Word(Latex):
         Returns:
             LayerWrapper: Wrapper around the indexed layer
         """
+        # the wrapper can change the layer and both braids
+        self.__mark_dirty(index + 1)
         return LayerWrapper(
-            self.__braids[index], self.__layers[index], self.__braids[index + 1]
+            self.__own_braid(index),
+            self.__own_layer(index),
+            self.__own_braid(index + 1),
+            self.__log,
         )
 
     def append_layer(self, l: Layer) -> None:
@@ -78,6 +171,20 @@ class Word(Latex):
             raise StrandMismatchException
         self.__layers.append(l)
         self.__braids.append(Braid(l.n_above()))
+        self.__own_layers.append(True)
+        self.__own_braids.append(True)
+        self.__connections.add(len(self.__layers) - 1, l)
+        self.__mark_dirty(len(self.__layers))
+        if self.__log is not None:
+            self.__log.record(self.__pop_layer)
+
+    def __pop_layer(self) -> None:
+        """Takes the top layer and braid off, undoing
+        append_layer"""
+        self.__connections.remove(self.__layers.pop())
+        self.__braids.pop()
+        self.__own_layers.pop()
+        self.__own_braids.pop()
 
     def append_braid(self, b: Braid) -> None:
         """Adds a braid on top of this word
@@ -86,19 +193,276 @@ class Word(Latex):
             b (Braid): Braid to be added on top
             of the word
         """
-        self.__braids[-1].extend(b)
+        top = self.__own_braid(len(self.__layers))
+        top.extend(b)
+        if self.__log is not None:
+            k = len(b)
+            self.__log.record(lambda: top.drop_last(k))
+        self.__mark_dirty(len(self.__layers))
+
+    def made_by(self, o: PrimitiveObject) -> Optional[int]:
+        """Finds the layer whose knit an object comes out of.
+        Objects are replaced by copies when a copied word
+        first changes their layer, so take them from the word
+
+        Args:
+            o (PrimitiveObject): Object in this word
+
+        Returns:
+            Optional[int]: Index in the layers list, or None if
+            no layer makes the object
+        """
+        return self.__connections.made_by(o)
+
+    def used_by(self, o: PrimitiveObject) -> Optional[int]:
+        """Finds the layer whose knit an object goes into
+
+        Args:
+            o (PrimitiveObject): Object in this word
+
+        Returns:
+            Optional[int]: Index in the layers list, or None if
+            no layer uses the object
+        """
+        return self.__connections.used_by(o)
+
+    def layers_touching(self, o: PrimitiveObject) -> list[int]:
+        """Finds the layers an object connects
+
+        Args:
+            o (PrimitiveObject): Object in this word
+
+        Returns:
+            list[int]: Indices of the layers making and using
+            the object, bottom up
+        """
+        ends = (self.__connections.made_by(o), self.__connections.used_by(o))
+        return [i for i in ends if i is not None]
+
+    def strand_positions(self, o: PrimitiveObject) -> list[tuple[int, int]]:
+        """Follows an object through the braids between the
+        layer making it and the layer using it, using the
+        braids' cached permutations
+
+        Args:
+            o (PrimitiveObject): Object in this word
+
+        Returns:
+            list[tuple[int, int]]: For each braid the object
+            goes through, bottom up, the braid's index and the
+            object's position at the bottom of the braid. Empty
+            if no layer makes or uses the object
+        """
+        made = self.__connections.made_by(o)
+        used = self.__connections.used_by(o)
+        positions: list[tuple[int, int]] = []
+        if made is not None:
+            l = self.__layer(made)
+            index = made + 1
+            position = l.left() + l.middle().true_outs().index(o)
+            while True:
+                positions.append((index, position))
+                if index in (used, len(self.__layers)):
+                    return positions
+                position = self.__braids[index].permutation().index(position)
+                l = self.__layer(index)
+                if position >= l.left() + l.middle().n_ins():
+                    position += l.middle().n_outs() - l.middle().n_ins()
+                index += 1
+        if used is not None:
+            l = self.__layer(used)
+            index = used
+            position = l.left() + l.middle().true_ins().index(o)
+            while True:
+                position = self.__braids[index].permutation()[position]
+                positions.append((index, position))
+                if index == 0:
+                    break
+                index -= 1
+                l = self.__layer(index)
+                if position >= l.left() + l.middle().n_outs():
+                    position -= l.middle().n_outs() - l.middle().n_ins()
+            positions.reverse()
+        return positions
+
+    def __mark_dirty(self, index: int) -> None:
+        """Records that the braid at this index, or the
+        layer below it, may no longer be canonical
+
+        Args:
+            index (int): Index in the braids list
+        """
+        self.__dirty = max(self.__dirty, index)
+
+    def is_canonical(self) -> bool:
+        """Whether nothing changed since the word was last
+        canonicalized. Braids changed through iteration
+        aren't tracked
+
+        Returns:
+            bool: True if canonicalize would be a no-op
+        """
+        return self.__dirty < 0
+
+    def canonicalize(self, processes: int = 0) -> None:
+        """Canonicalizes the word in place
+
+        Args:
+            processes (int, optional): Worker processes for the
+            components and the braid canonicalization. Defaults to 0.
+        """
+        Word.canonicalize_many([self], processes)
+
+    def components(self) -> list[list[int]]:
+        """Groups the layers by component, see layer.components
+
+        Returns:
+            list[list[int]]: Indices of each component's layers,
+            bottom up. Components without layers are left out
+        """
+        split = Components(
+            [self.__layer(i) for i in range(len(self.__layers))], self.__braids
+        )
+        return [c for c in map(split.layers_of, range(split.count())) if c]
+
+    @staticmethod
+    def canonicalize_many(words: Sequence[Word], processes: int = 0) -> None:
+        """Canonicalizes several words in place. No layer
+        operation reads a braid after the layer below it
+        is done, so every braid of every word is
+        canonicalized in one batch at the end. Layers above
+        the topmost change since the last canonicalization,
+        and the braids above them, are left alone.
+
+        With processes positive, the layers of a word that
+        splits into several components (see layer.components)
+        are canonicalized one component per task in a process
+        pool, then joined back before the batch
+
+        Args:
+            words (Sequence[Word]): Words to canonicalize
+            processes (int, optional): Worker processes. Defaults to 0.
+        """
+        # pylint: disable=protected-access,unused-private-member
+        # pylint: disable=import-outside-toplevel
+        from concurrent.futures import ProcessPoolExecutor
+
+        splits: dict[int, tuple[Components, list[Word], list[_Objects]]] = {}
+        if processes > 0:
+            for k, w in enumerate(words):
+                split = w.__split()
+                if split is not None:
+                    splits[k] = split
+        executor = ProcessPoolExecutor(max_workers=processes) if splits else None
+        try:
+            futures: dict[int, list[Optional[Future[_Part]]]] = {}
+            if executor is not None:
+                for k, (_, parts, objects) in splits.items():
+                    futures[k] = [
+                        executor.submit(_canonicalize_layers, part, objs) if objs else None
+                        for part, objs in zip(parts, objects)
+                    ]
+            # the other words' layers are canonicalized here
+            # while the pool works
+            braids: list[Braid] = []
+            for k, w in enumerate(words):
+                if k in splits:
+                    braids.extend(w.__join(*splits[k], futures[k]))
+                    continue
+                for i in range(w.__dirty - 1, -1, -1):
+                    w.layer_at(i).canonicalize_layer()
+                owned = [w.__own_braid(i) for i in range(w.__dirty + 1)]
+                for b in owned:
+                    w.__log_braid(b)
+                braids.extend(owned)
+        finally:
+            if executor is not None:
+                executor.shutdown()
+        Braid.set_canon_many(braids, processes)
+        for w in words:
+            w.__dirty = -1
+
+    def __split(self) -> Optional[tuple[Components, list[Word], list[_Objects]]]:
+        """Splits the part of the word below the topmost change
+        into a word for each component
 
-    def canonicalize(self) -> None:
-        """Canonicalizes the word in place"""
-        for i in range(len(self.__layers) - 1, -1, -1):
-            self.layer_at(i).canonicalize()
-            # l = self.__layers[i]
-            # above = self.__braids[i + 1]
-            # below = self.__braids[i]
-            # emit = l.canonicalize(above)
-            # emit.apply(below, above)
-            # above.set_canon()
-        self.__braids[0].set_canon()
+        Returns:
+            Optional[tuple[Components, list[Word], list[_Objects]]]: The
+            components, the word of each and the objects in its
+            knits, or None if in a transaction or fewer than two
+            components have layers
+        """
+        # pylint: disable=protected-access,unused-private-member
+        if self.__log is not None or self.__dirty < 0:
+            return None
+        layers = [self.__layer(i) for i in range(self.__dirty)]
+        split = Components(layers, self.__braids[: self.__dirty + 1])
+        if len({split.of_layer(i) for i in range(len(layers))}) < 2:
+            return None
+        parts = [Word(split.width(0, c)) for c in range(split.count())]
+        objects: list[_Objects] = [[] for _ in parts]
+        for index in range(self.__dirty + 1):
+            gens = split.split_braid(index, self.__braids[index])
+            for part, word in zip(parts, gens):
+                if word:
+                    part.append_braid(Braid.from_word(part.__braids[-1].n(), word))
+            if index < len(layers):
+                c = split.of_layer(index)
+                parts[c].append_layer(split.split_layer(index, layers[index]))
+                knit = layers[index].middle()
+                objects[c].extend(knit.true_ins() + knit.true_outs())
+        return split, parts, objects
+
+    def __join(
+        self,
+        split: Components,
+        parts: list[Word],
+        objects: list[_Objects],
+        futures: list[Optional[Future[_Part]]],
+    ) -> list[Braid]:
+        """Takes over the layers and braids of the components
+        canonicalized in the pool. The objects in their knits
+        are copies, which replace this word's objects
+
+        Args:
+            split (Components): Components the word was split into
+            parts (list[Word]): Word of each component
+            objects (list[_Objects]): Objects in each word's knits
+            futures (list[Optional[Future[_Part]]]): Canonicalized
+            word and copied objects of each component, or None
+            for components without layers
+
+        Returns:
+            list[Braid]: The braids below the topmost change, which
+            this word owns and which aren't canonical yet
+        """
+        # pylint: disable=protected-access,unused-private-member
+        for c, future in enumerate(futures):
+            if future is not None:
+                parts[c], copies = future.result()
+                for o, copy in zip(objects[c], copies):
+                    self.__clones[o] = copy
+                    self.__clones[copy] = copy
+        for i in range(self.__dirty, len(self.__layers)):
+            if self.__own_layers[i]:
+                self.__layers[i] = self.__layers[i].relink(self.__clones)
+        bottom: list[int] = []
+        for c, part in enumerate(parts):
+            bottom.extend(split.join_braid(0, c, part.__braids[0].word()))
+            for k, index in enumerate(split.layers_of(c)):
+                self.__layers[index] = split.join_layer(index, part.__layers[k])
+                self.__own_layers[index] = True
+                self.__braids[index + 1] = Braid.from_word(
+                    self.__braids[index + 1].n(),
+                    split.join_braid(index + 1, c, part.__braids[k + 1].word()),
+                )
+        self.__braids[0] = Braid.from_word(self.__braids[0].n(), bottom)
+        for index in range(self.__dirty + 1):
+            self.__own_braids[index] = True
+        self.__connections = Connections()
+        for i in range(len(self.__layers)):
+            self.__connections.add(i, self.__layer(i))
+        return self.__braids[: self.__dirty + 1]
 
     def attempt_swap(self, index: int) -> bool:
         """Attempts to move a layer up one index.
@@ -115,21 +479,168 @@ class Word(Latex):
         self.layer_at(index + 1).flip_macro()
         return self.__swap_if_identity(index)
 
+    def reorder(self) -> int:
+        """Moves layers past each other into the canonical
+        order of schedule.canonical_order, with the fewest
+        swaps. Layers only move across identity braids, so
+        each run of layers between braids that aren't the
+        identity is reordered on its own. A run of L layers
+        takes O(L log L) to order plus one swap per pair of
+        layers it puts the other way round, so O(L^2) swaps
+        at worst
+
+        Raises:
+            SwapException: when two layers the order moves past
+                each other don't swap
+
+        Returns:
+            int: Number of swaps made
+        """
+        swaps = 0
+        start = 0
+        for end in range(1, len(self.__layers) + 1):
+            if end == len(self.__layers) or not self.__braids[end].is_identity():
+                swaps += self.__reorder_run(start, end)
+                start = end
+        return swaps
+
+    def __reorder_run(self, start: int, end: int) -> int:
+        """Reorders layers with identity braids between them
+
+        Args:
+            start (int): Index of the run's bottom layer
+            end (int): Index just past the run's top layer
+
+        Raises:
+            SwapException: when two layers the order moves past
+                each other don't swap
+
+        Returns:
+            int: Number of swaps made
+        """
+        run = [self.__layer(i) for i in range(start, end)]
+        swaps = schedule.swap_sequence(schedule.canonical_order(run))
+        for index in swaps:
+            if not self.__swap_if_identity(start + index):
+                raise SwapException()
+        return len(swaps)
+
     def __swap_if_identity(self, index: int) -> bool:
-        middle = self.__braids[index + 1]
-        middle.set_canon()
-        if len(middle) == 0:
-            below = self.__layers[index]
-            above = self.__layers[index + 1]
+        middle = self.__own_braid(index + 1)
+        if middle.is_identity():
+            self.__log_braid(middle)
+            middle.reset_to(Braid(middle.n()))
+            below = self.__own_layer(index)
+            above = self.__own_layer(index + 1)
             if below.swap(above):
                 self.__layers[index : index + 2] = [above, below]
+                self.__connections.swap(index, below, above)
                 self.__braids[index + 1] = Braid(above.n_above())
+                self.__mark_dirty(index + 2)
+                if self.__log is not None:
+                    self.__log.record(lambda: self.__unswap(index, middle))
                 return True
             else:
                 return False
         else:
             return False
 
+    def __unswap(self, index: int, middle: Braid) -> None:
+        """Swaps two layers back, undoing a swap
+
+        Args:
+            index (int): Index the below layer was moved up from
+            middle (Braid): Braid that was between them
+
+        Raises:
+            SwapException: when the layers don't swap back
+        """
+        above = self.__layers[index]
+        below = self.__layers[index + 1]
+        if not above.swap(below):
+            raise SwapException()
+        self.__layers[index : index + 2] = [below, above]
+        self.__connections.swap(index, above, below)
+        self.__braids[index + 1] = middle
+
+    def try_swap(self, index: int) -> bool:
+        """Attempts to move a layer up one index, like
+        attempt_swap, but leaves the word as it was when
+        the layers can't be swapped
+
+        Args:
+            index (int): Index to move up
+
+        Returns:
+            bool: Whether the layers were swapped
+        """
+        started = self.__log is None
+        if started:
+            self.begin_transaction()
+        log = cast(UndoLog, self.__log)
+        mark = len(log)
+        dirty = self.__dirty
+        swapped = False
+        try:
+            swapped = self.attempt_swap(index)
+        finally:
+            # also leaves the word as it was when the swap raises
+            if not swapped:
+                log.rollback(mark)
+                self.__dirty = dirty
+            if started:
+                self.commit()
+        return swapped
+
+    def begin_transaction(self) -> None:
+        """Starts logging how to reverse changes made through
+        this word, so that rollback can take them back
+        without a copy of the word. Changes to braids and
+        layers got by iterating over the word aren't logged
+
+        Raises:
+            TransactionException: when already in a transaction
+        """
+        if self.__log is not None:
+            raise TransactionException()
+        self.__log = UndoLog()
+        self.__log_dirty = self.__dirty
+
+    def commit(self) -> None:
+        """Keeps the changes made in the transaction and
+        ends it
+
+        Raises:
+            TransactionException: when not in a transaction
+        """
+        if self.__log is None:
+            raise TransactionException()
+        self.__log = None
+
+    def rollback(self) -> None:
+        """Reverses the changes made in the transaction and
+        ends it
+
+        Raises:
+            TransactionException: when not in a transaction
+        """
+        if self.__log is None:
+            raise TransactionException()
+        self.__log.rollback()
+        self.__log = None
+        self.__dirty = self.__log_dirty
+
+    def __log_braid(self, b: Braid) -> None:
+        """Records how to restore a braid that's about to be
+        rewritten, if in a transaction
+
+        Args:
+            b (Braid): Braid owned by this word
+        """
+        if self.__log is not None:
+            old = b.copy()
+            self.__log.record(lambda: b.reset_to(old))
+
     def fuzz(self, rng: Callable[[], float], layer_muts: int, braid_muts: int) -> None:
         """Fuzzes the word in place. Executes layer_muts layer mutations
         at each layer, then braid_muts braid mutations at each
@@ -172,7 +683,10 @@ class Word(Latex):
             rng (Callable[[], float]): [0, 1] random number generator
             braid_muts (int): Number of mutation attempts to make
         """
-        self.__braids[index].fuzz(rng, braid_muts)
+        b = self.__own_braid(index)
+        self.__log_braid(b)
+        b.fuzz(rng, braid_muts)
+        self.__mark_dirty(index)
 
     def draw_preamble(self, draw: int) -> None:
         """Setter
@@ -193,13 +707,14 @@ class Word(Latex):
         self.__draw_postamble = draw
 
     def __repr__(self) -> str:
-        repr_str = ":".join([repr(obj) for obj in self])
+        repr_str = ":".join([repr(obj) for obj in self.__parts()])
         return f"Word({repr_str})"
 
     def __eq__(self, other: object) -> bool:
+        # pylint: disable=protected-access
         if not isinstance(other, Word):
             return False
-        return list(self) == list(other)
+        return list(self.__parts()) == list(other.__parts())
 
     def __iter__(self) -> Word:
         self.__iter_index = 0
@@ -207,18 +722,31 @@ class Word(Latex):
         return self
 
     def __next__(self) -> Union[Braid, Layer]:
+        # the caller may mutate what's returned
         if self.__iter_braid_next:
-            b = self.__braids[self.__iter_index]
+            b = self.__own_braid(self.__iter_index)
             self.__iter_braid_next = False
             return b
         else:
             if self.__iter_index >= len(self.__layers):
                 raise StopIteration
-            l = self.__layers[self.__iter_index]
+            l = self.__own_layer(self.__iter_index)
             self.__iter_braid_next = True
             self.__iter_index += 1
             return l
 
+    def __parts(self) -> Iterator[Union[Braid, Layer]]:
+        """Reads the braids and layers from the bottom up,
+        without taking them over. They mustn't be mutated
+
+        Yields:
+            Iterator[Union[Braid, Layer]]: Braids and layers
+        """
+        for i in range(len(self.__layers)):
+            yield self.__braids[i]
+            yield self.__layer(i)
+        yield self.__braids[-1]
+
     def __len__(self) -> int:
         return len(self.__braids) * 2 - 1
 
@@ -226,7 +754,7 @@ class Word(Latex):
         latex_str = ""
         for i, s in enumerate(self.labels_in):
             latex_str += f"\\knitLabel{{{x+i}}}{{{y-1.3}}}{{${s}$}}\n"
-        for i, o in enumerate(self):
+        for i, o in enumerate(self.__parts()):
             num_iters = 1
             if isinstance(o, Braid):
                 if i == 0:
@@ -255,13 +783,41 @@ class Word(Latex):
 
     def latex_height(self) -> int:
         h = 0
-        for o in self:
+        for o in self.__parts():
             h += o.latex_height()
         return h
 
     def context_out(
         self, context: Sequence[PrimitiveObject]
     ) -> Sequence[PrimitiveObject]:
-        for o in self:
+        for o in self.__parts():
             context = o.context_out(context)
         return context
+
+
+_Objects = list[PrimitiveObject]
+_Part = tuple[Word, _Objects]
+
+
+def _canonicalize_layers(w: Word, objects: _Objects) -> _Part:
+    """Canonicalizes the layers of a component's word in a
+    worker process, leaving its braids to the parent
+
+    Args:
+        w (Word): Word of one component
+        objects (_Objects): Objects in its knits, pickled with
+        it so that the copies come back in the same order
+
+    Returns:
+        _Part: The word and the copies of the objects
+    """
+    for i in range(len(w) // 2 - 1, -1, -1):
+        w.layer_at(i).canonicalize_layer()
+    return w, objects
+
+
+class SwapException(Exception):
+    """
+    Raised when two layers that have to
+    swap to keep the word consistent don't
+    """
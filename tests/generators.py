@@ -0,0 +1,140 @@
+"""Random braids and words shared by the fuzz tests
+and the benchmarks"""
+
+import random
+from braid.braid import Braid
+from braid.braid_generator import BraidGenerator
+from category.morphism import Knit
+from category.object import Loop
+from common.common import Bed, Dir
+from layer.layer import Layer
+from layer.word import Word
+
+MIN_INS = 0
+MAX_INS = 5
+MIN_OUTS = 2
+MAX_OUTS = 5
+LETTERS_PER_WORD = 10
+
+
+def random_braid_word(n: int, length: int) -> Braid:
+    """Generates a random braid word.
+
+    Args:
+        n (int): Number of strands
+        length (int): Number of generators
+
+    Returns:
+        Braid: Random braid word
+    """
+    word = Braid(n)
+    if n >= 2:
+        for _ in range(length):
+            i = int(random.random() * (n - 1))  # generator index
+            pos = random.random() < 0.5
+            word.append(BraidGenerator.get(i, pos))
+    return word
+
+
+def random_word(num_boxes: int, rng: random.Random) -> Word:
+    """Generates a random Word.
+
+    Args:
+        num_boxes (int): Number of boxes
+        rng (random.Random): Thread-specific random number generator
+
+    Returns:
+        Word: Random layer
+    """
+    w = Word()
+    prev_strands = 0
+    for _ in range(num_boxes):
+        knit_ins = min(int(rng.random() * (MAX_INS - MIN_INS)) + MIN_INS, prev_strands)
+        knit_outs = int(rng.random() * (MAX_OUTS - MIN_OUTS)) + MIN_OUTS
+        k = Knit(
+            Bed(rng.random() < 0.5),
+            Dir(rng.random() < 0.5),
+            [Loop(0) for _ in range(knit_ins)],
+            [Loop(0) for _ in range(knit_outs)],
+        )
+        left = int(rng.random() * (prev_strands - knit_ins))
+        b = random_braid_word(prev_strands + knit_outs - knit_ins, LETTERS_PER_WORD)
+        w.append_layer(Layer(left, k, prev_strands - left - knit_ins))
+        w.append_braid(b)
+        prev_strands = b.n()
+    return w
+
+
+def connected_word(
+    num_boxes: int, rng: random.Random, letters: int = LETTERS_PER_WORD
+) -> Word:
+    """Generates a random Word whose knits take in the
+    objects that come out of the knits below them
+
+    Args:
+        num_boxes (int): Number of boxes
+        rng (random.Random): Random number generator
+        letters (int, optional): Generators in each braid.
+        Defaults to LETTERS_PER_WORD.
+
+    Returns:
+        Word: Random word
+    """
+    w = Word()
+    for _ in range(num_boxes):
+        context = list(w.context_out([]))
+        knit_ins = min(rng.randrange(MIN_INS, MAX_INS), len(context))
+        knit_outs = rng.randrange(MIN_OUTS, MAX_OUTS)
+        left = rng.randrange(len(context) - knit_ins + 1)
+        k = Knit(
+            Bed(rng.random() < 0.5),
+            Dir(rng.random() < 0.5),
+            list(context[left : left + knit_ins]),
+            [Loop(0) for _ in range(knit_outs)],
+        )
+        w.append_layer(Layer(left, k, len(context) - left - knit_ins))
+        w.append_braid(random_braid_word(len(context) + knit_outs - knit_ins, letters))
+    return w
+
+
+def wide_word(
+    components: int, num_boxes: int, rng: random.Random, letters: int = LETTERS_PER_WORD
+) -> Word:
+    """Generates a random Word made of connected words side by
+    side, whose braids never cross strands of two of them
+
+    Args:
+        components (int): Number of words side by side
+        num_boxes (int): Number of boxes, across all of them
+        rng (random.Random): Random number generator
+        letters (int, optional): Generators in each braid.
+        Defaults to LETTERS_PER_WORD.
+
+    Returns:
+        Word: Random word
+    """
+    w = Word()
+    widths = [0] * components
+    for _ in range(num_boxes):
+        context = list(w.context_out([]))
+        c = rng.randrange(components)
+        offset = sum(widths[:c])
+        knit_ins = min(rng.randrange(MIN_INS, MAX_INS), widths[c])
+        knit_outs = rng.randrange(MIN_OUTS, MAX_OUTS)
+        left = offset + rng.randrange(widths[c] - knit_ins + 1)
+        k = Knit(
+            Bed(rng.random() < 0.5),
+            Dir(rng.random() < 0.5),
+            list(context[left : left + knit_ins]),
+            [Loop(0) for _ in range(knit_outs)],
+        )
+        w.append_layer(Layer(left, k, len(context) - left - knit_ins))
+        widths[c] += knit_outs - knit_ins
+        b = Braid(len(context) + knit_outs - knit_ins)
+        wide = [i for i in range(components) if widths[i] >= 2]
+        for _ in range(letters if wide else 0):
+            i = rng.choice(wide)
+            g = sum(widths[:i]) + rng.randrange(widths[i] - 1)
+            b.append(BraidGenerator.get(g, rng.random() < 0.5))
+        w.append_braid(b)
+    return w
@@ -2,7 +2,17 @@
 canonicalization using an example
 from the 2008 paper"""
 
-from braid.braid import Braid
+import importlib
+from pathlib import Path
+from typing import Sequence
+import pytest
+from braid.braid import Braid, GeneratorOutOfBoundsException
+from braid.braid_generator import BraidGenerator
+from braid.canon import backend, garside, handle
+from braid.canon.cache import CanonCache
+from braid.canon.reduce import FreeReducer
+from category.object import Loop, PrimitiveObject
+from common.common import Sign
 
 EXAMPLE_2008_STRING = "aBabacABABAbbCB"
 
@@ -38,3 +48,180 @@ def test_identity_identity() -> None:
     b = Braid.str_to_braid(2, "aaAA")
     cb = b.canon()
     assert cb == Braid(2).canon()
+
+
+def test_native_engine_pins_sage_output() -> None:
+    """The native engine spells the 2008 example
+    the way sagemath did, without going through Braid"""
+    word = [g.to_sage() for g in Braid.str_to_braid(4, EXAMPLE_2008_STRING)]
+    expected = [g.to_sage() for g in Braid.str_to_braid(4, "ABACBAABACBAacabcbbcbaa")]
+    assert garside.canonical_word(4, word) == expected
+
+
+def test_backend_selection(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Switching backends is validated, and the
+    environment variable picks the default"""
+    before = backend.get_backend()
+    try:
+        backend.set_backend("native")
+        assert backend.get_backend() == "native"
+        assert str(Braid.str_to_braid(4, "aBaba").canon()) == "aab"
+        with pytest.raises(ValueError):
+            backend.set_backend("magma")
+        assert backend.get_backend() == "native"
+
+        backend.register_backend("garside", "braid.canon.garside")
+        backend.set_backend("garside")
+        assert "garside" in backend.backends()
+        assert str(Braid.str_to_braid(4, "aBaba").canon()) == "aab"
+
+        monkeypatch.setenv("BRAID_CANON_BACKEND", "sage")
+        importlib.reload(backend)
+        assert backend.get_backend() == "sage"
+        monkeypatch.setenv("BRAID_CANON_BACKEND", "magma")
+        with pytest.raises(ValueError):
+            importlib.reload(backend)
+    finally:
+        monkeypatch.delenv("BRAID_CANON_BACKEND")
+        importlib.reload(backend)
+        backend.set_backend(before)
+
+
+def test_word_round_trip() -> None:
+    """Braids keep their generators in sage encoding
+    and rebuild the same generators when iterated"""
+    b = Braid.str_to_braid(4, "aBc")
+    assert list(b.word()) == [1, -2, 3]
+    assert Braid.from_word(4, b.word()) == b
+    assert [str(g) for g in b] == ["a", "B", "c"]
+    c = b.copy()
+    c.extend(b)
+    assert str(c) == "aBcaBc" and str(b) == "aBc"
+    with pytest.raises(GeneratorOutOfBoundsException):
+        Braid.from_word(3, [3])
+
+
+def test_shared_instances() -> None:
+    """Generators from braids are interned and
+    signs are two-valued singletons"""
+    b = Braid.str_to_braid(3, "abA")
+    gens = list(b) + list(b)
+    assert gens[0] is gens[3] is BraidGenerator.get(0, True)
+    assert gens[2] is BraidGenerator.get(0, False)
+    assert Sign(True).flip() is Sign(False)
+
+
+def test_canon_cache(tmp_path: Path) -> None:
+    """Canonical words are cached under both the input
+    and their own key, and survive a trip to disk
+    under the same engine only"""
+    cache = CanonCache(size=8)
+    word = [g.to_sage() for g in Braid.str_to_braid(4, EXAMPLE_2008_STRING)]
+    assert cache.get(4, word) is None
+    canon = garside.canonical_word(4, word)
+    cache.put(4, word, canon)
+    assert cache.get(4, word) == canon
+    assert cache.get(4, canon) == canon
+    assert (cache.hits(), cache.misses()) == (2, 1)
+
+    path = str(tmp_path / "canon.cache")
+    cache.save(path, "native")
+    loaded = CanonCache(size=1)
+    loaded.load(path, "native")
+    assert len(loaded) == 1
+    assert loaded.get(4, canon) == canon
+    other = CanonCache()
+    other.load(path, "sage")
+    assert len(other) == 0
+
+    cache.resize(0)
+    cache.put(4, word, canon)
+    assert len(cache) == 0
+
+
+def test_pooled_canon_fills_cache() -> None:
+    """Braids canonicalized in a process pool are cached
+    in the parent process"""
+    braid = Braid.str_to_braid(4, EXAMPLE_2008_STRING)
+    backend.cache.clear()
+    canon = Braid.canon_many([braid, braid.copy()], processes=2)
+    assert backend.cache.get(4, braid.word()) == canon[0].word().tolist()
+    assert Braid.canon_many([braid], processes=2) == canon[:1]
+
+
+def test_permutation() -> None:
+    """The cached permutation matches chaining the generators'
+    contexts, and survives edits that keep the braid's value"""
+    b = Braid.str_to_braid(4, "abCab")
+    loops: Sequence[PrimitiveObject] = [Loop(0) for _ in range(4)]
+    context = loops
+    for g in b:
+        context = g.context_out(context)
+    assert b.context_out(loops) == context
+    assert [loops[p] for p in b.permutation()] == context
+
+    b.append(BraidGenerator.get(2, True))
+    b.set_canon()
+    assert b.permutation() == Braid.from_word(4, b.word()).permutation()
+    b.prepend(BraidGenerator.get(0, False))
+    assert b.permutation() == Braid.from_word(4, b.word()).permutation()
+    b.intend(Braid.str_to_braid(4, "bcAb"))
+    b.permutation()
+    b.drop_first(5)
+    assert b.permutation() == Braid.from_word(4, b.word()).permutation()
+    assert Braid.str_to_braid(3, "abAB").is_pure() is False
+    assert Braid.str_to_braid(3, "aa").is_pure()
+
+
+def test_free_reduction() -> None:
+    """Inverse pairs cancel through commuting generators
+    only, and the reducer counts what it removed"""
+    reducer = FreeReducer()
+
+    def reduce(s: str) -> str:
+        word = [g.to_sage() for g in Braid.str_to_braid(5, s)]
+        return str(Braid.from_word(5, reducer.reduce(5, word)))
+
+    assert reduce("aBbA") == ""
+    assert reduce("acdA") == "cd"
+    assert reduce("abA") == "abA"
+    assert reduce("aCbcA") == "aCbcA"
+    assert reduce("cAbBac") == "cc"
+    assert (reducer.letters_in(), reducer.letters_out()) == (22, 12)
+
+    word = [g.to_sage() for g in Braid.str_to_braid(4, EXAMPLE_2008_STRING)]
+    reduced = reducer.reduce(4, word)
+    assert garside.canonical_word(4, reduced) == garside.canonical_word(4, word)
+
+
+def test_fingerprint() -> None:
+    """Equivalent braids share a fingerprint, kept up to date
+    as generators are added on either end"""
+    a = Braid.str_to_braid(4, EXAMPLE_2008_STRING)
+    canon = a.canon()
+    assert a.fingerprint() == canon.fingerprint()
+    for s, t, same in [("aba", "bab", True), ("ac", "ca", True), ("ab", "ba", False)]:
+        fingerprints = [Braid.str_to_braid(4, w).fingerprint() for w in (s, t)]
+        assert (fingerprints[0] == fingerprints[1]) == same
+
+    a.fingerprint()
+    a.append(BraidGenerator.get(1, False))
+    a.prepend(BraidGenerator.get(2, True))
+    assert a.fingerprint() == Braid.from_word(4, a.word()).fingerprint()
+    assert a.equivalent(Braid.from_word(4, a.canon().word()))
+    assert not a.equivalent(canon)
+
+
+def test_handle_reduction() -> None:
+    """Handle reduction empties exactly the trivial words"""
+    assert Braid.str_to_braid(4, "abABAbaB").is_identity() is False
+    assert Braid.str_to_braid(4, "abaBAB").is_identity()
+    assert Braid.str_to_braid(4, "acbCBA").is_identity() is False
+    assert Braid.str_to_braid(4, "abcCBA").is_identity()
+    assert handle.reduce_handles(3, [1, 2, -1]) == [-2, 1, 2]
+
+    b = Braid.str_to_braid(4, EXAMPLE_2008_STRING)
+    assert b.equivalent(b.canon())
+    b.append(BraidGenerator.get(0, True))
+    b.append(BraidGenerator.get(0, True))
+    assert not b.equivalent(b.canon().flip_vertical())
@@ -0,0 +1,46 @@
+"""Tests the canonicalization server with
+the native engine, so no sagemath is needed"""
+
+import sys
+import threading
+from multiprocessing import Pool
+from pathlib import Path
+import pytest
+from braid import sage
+from braid.braid import Braid
+from braid.canon import garside, server
+
+EXAMPLE_2008_STRING = "aBabacABABAbbCB"
+
+
+def test_server_round_trip(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Clients get the engine's canonical words back, and
+    braid.sage becomes a client when the server is up"""
+    path = str(tmp_path / "canon.sock")
+    word = [g.to_sage() for g in Braid.str_to_braid(4, EXAMPLE_2008_STRING)]
+    assert server.canonical_words(path, 4, [word]) is None
+
+    with Pool(1) as pool:
+        with server.CanonServer(path, pool, "native") as srv:
+            thread = threading.Thread(target=srv.serve_forever, daemon=True)
+            thread.start()
+            try:
+                words = server.canonical_words(path, 4, [word, [], [1, -1]])
+                assert words == [garside.canonical_word(4, word), [], []]
+
+                monkeypatch.setenv(server.SERVER_ENV, path)
+                syllables = sage.canonicalize_braid(4, word)
+                assert Braid.from_sage(syllables, 4) == Braid.from_word(4, words[0])
+                assert "sage.all" not in sys.modules
+            finally:
+                srv.shutdown()
+                thread.join()
+
+
+def test_serve_keeps_other_files(tmp_path: Path) -> None:
+    """Only a stale socket is replaced, never another file"""
+    path = tmp_path / "notes.txt"
+    path.write_text("keep me")
+    with pytest.raises(FileExistsError):
+        server.serve(str(path), engine="native")
+    assert path.read_text() == "keep me"
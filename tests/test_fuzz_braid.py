@@ -3,8 +3,11 @@ using fuzzing"""
 
 import random
 from time import perf_counter
+import pytest
 from braid.braid import Braid
+from braid.canon import garside
 from braid.braid_generator import BraidGenerator
+from tests.generators import random_braid_word
 
 # TODO: make these fuzzing tests geometric instead of uniform distributions
 MIN_N = 5
@@ -12,32 +15,13 @@ MAX_N = 50
 WORDS_PER_N = 1
 LETTERS_PER_WORD = 10
 MUTANTS_PER_WORD = 5
-MUTATION_ATTEMPTS_PER_WORD = 100
+MUTATION_ROUNDS_PER_WORD = 10
 # Took ~48 seconds with the above settings
 
 rng = random.random
 random.seed(42)
 
 
-def random_braid_word(n: int, length: int) -> Braid:
-    """Generates a random braid word.
-
-    Args:
-        n (int): Number of strands
-        length (int): Number of generators
-
-    Returns:
-        Braid: Random braid word
-    """
-    word = Braid(n)
-    if n >= 2:
-        for _ in range(length):
-            i = int(rng() * (n - 1))  # generator index
-            pos = rng() < 0.5
-            word.append(BraidGenerator(i, pos))
-    return word
-
-
 def test_braid_fuzzing_preserves_equivalence() -> None:
     """Tests the braid canonicalization by fuzzing various
     braids, computing their canonical forms, and asserting
@@ -51,11 +35,11 @@ def test_braid_fuzzing_preserves_equivalence() -> None:
             original_braid = random_braid_word(n, LETTERS_PER_WORD)
             original_canon = original_braid.canon()
 
-            for _ in range(MUTANTS_PER_WORD):
-                # Create a mutant of the original braid by fuzzing it
-                mutant_braid = original_braid.copy()
-                mutant_braid.fuzz(rng=random.random, steps=MUTATION_ATTEMPTS_PER_WORD)
-
+            # Create mutants of the original braid by fuzzing it
+            mutants = original_braid.fuzz_many(
+                MUTANTS_PER_WORD, MUTATION_ROUNDS_PER_WORD, seed=n * WORDS_PER_N + i
+            )
+            for mutant_braid in mutants:
                 # Check that the canonical forms of the original and mutant are equivalent
                 start = perf_counter()
                 mutant_canon = mutant_braid.canon()
@@ -64,12 +48,71 @@ def test_braid_fuzzing_preserves_equivalence() -> None:
 
                 mutant_canon_canon = mutant_canon.canon()
 
+                assert (
+                    mutant_braid.fingerprint() == original_braid.fingerprint()
+                ), f"Burau fingerprint changed after fuzzing for n={n}"
+
                 # print()
                 # print(repr(list(original_braid)))
                 # print([repr(g) for g in list(mutant_braid)])
                 assert (
                     original_canon == mutant_canon
                 ), f"Braid mismatch after fuzzing for n={n}"
-                assert mutant_canon == mutant_canon_canon, "Sage conversion error!"
+                assert mutant_canon == mutant_canon_canon, "Canon form is not a fixed point!"
         times.append(time)
     print(times)
+
+
+def test_native_canon_matches_sage() -> None:
+    """Cross-checks the native Garside engine against
+    sagemath on random braid words"""
+    pytest.importorskip("sage.all")
+    # pylint: disable=import-outside-toplevel
+    from braid import sage
+
+    for n in range(MIN_N, MAX_N + 1, 5):
+        for _ in range(MUTANTS_PER_WORD):
+            word = [g.to_sage() for g in random_braid_word(n, LETTERS_PER_WORD * 5)]
+            assert garside.canonicalize_braid(n, word) == sage.canonicalize_braid(
+                n, word
+            ), f"Native canon disagrees with sage for n={n}: {word}"
+
+
+def naive_subbraid(braid: Braid, keep: set[int]) -> Braid:
+    """Subbraid by recounting the kept strands at every
+    crossing, to check Braid.subbraid against"""
+    keep = set(keep)
+    sub = Braid(len(keep))
+    for g in braid:
+        i = g.i()
+        if i in keep and i + 1 in keep:
+            sub.append(BraidGenerator.get(sum(x < i for x in keep), g.pos()))
+        elif i in keep:
+            keep.remove(i)
+            keep.add(i + 1)
+        elif i + 1 in keep:
+            keep.remove(i + 1)
+            keep.add(i)
+    return sub
+
+
+def test_subbraids_match_naive() -> None:
+    """Rank-tracked subbraids agree with recounting
+    the kept strands"""
+    for n in range(2, 12):
+        braid = random_braid_word(n, LETTERS_PER_WORD * 5)
+        keeps = [{i for i in range(n) if rng() < 0.5} for _ in range(4)]
+        expected = [naive_subbraid(braid, keep) for keep in keeps]
+        assert [braid.subbraid(keep) for keep in keeps] == expected
+
+
+def test_batched_fuzzing_preserves_equivalence() -> None:
+    """Mutants from the batched fuzzer are equivalent to the
+    original and the same seed gives the same mutants"""
+    for n in range(2, 12):
+        original = random_braid_word(n, LETTERS_PER_WORD)
+        original_canon = original.canon()
+        mutants = original.fuzz_many(MUTANTS_PER_WORD, 20, seed=n)
+        assert mutants == original.fuzz_many(MUTANTS_PER_WORD, 20, seed=n)
+        for mutant in mutants:
+            assert mutant.canon() == original_canon, f"Braid mismatch for n={n}"
@@ -2,24 +2,24 @@
 
 import random
 from concurrent.futures import FIRST_EXCEPTION, ProcessPoolExecutor, wait
+from typing import Sequence
 
+import pytest
 from braid.braid import Braid
 from category.morphism import Knit
-from category.object import Loop
-from common.common import Bed, Dir
+from category.object import Loop, PrimitiveObject
+from common.common import Bed, Dir, Sign
+from layer.emit_templates import templates
 from layer.layer import Layer
+from layer.stream import canonicalize_stream
+from layer.undo import TransactionException
 from layer.word import Word
-from tests.test_fuzz_braid import random_braid_word
+from tests.generators import connected_word, random_braid_word, random_word, wide_word
 
 # Constants
 MIN_BOXES = 1
 MAX_BOXES = 4
-MIN_INS = 0
-MAX_INS = 5
-MIN_OUTS = 2
-MAX_OUTS = 5
 WORDS_PER_NUM_BOXES = 1
-LETTERS_PER_WORD = 10
 MUTANTS_PER_WORD = 20
 LAYER_MUTATIONS_PER_LAYER = 3
 BRAID_MUTATIONS_PER_BRAID = 15
@@ -31,33 +31,6 @@ THREADS = 4
 BASE_SEED = 7000
 
 
-def random_word(num_boxes: int, rng: random.Random) -> Word:
-    """Generates a random Word.
-
-    Args:
-        num_boxes (int): Number of boxes
-        rng (random.Random): Thread-specific random number generator
-
-    Returns:
-        Word: Random layer
-    """
-    w = Word()
-    prev_strands = 0
-    for _ in range(num_boxes):
-        knit_ins = min(int(rng.random() * (MAX_INS - MIN_INS)) + MIN_INS, prev_strands)
-        knit_outs = int(rng.random() * (MAX_OUTS - MIN_OUTS)) + MIN_OUTS
-        k = Knit(
-            Bed(rng.random() < 0.5),
-            Dir(rng.random() < 0.5),
-            [Loop(0) for _ in range(knit_ins)],
-            [Loop(0) for _ in range(knit_outs)],
-        )
-        left = int(rng.random() * (prev_strands - knit_ins))
-        b = random_braid_word(prev_strands + knit_outs - knit_ins, LETTERS_PER_WORD)
-        w.append_layer(Layer(left, k, prev_strands - left - knit_ins))
-        w.append_braid(b)
-        prev_strands = b.n()
-    return w
 
 
 def fuzz_word_canonicalization(seed: int, thread_id: int) -> None:
@@ -79,6 +52,7 @@ def fuzz_word_canonicalization(seed: int, thread_id: int) -> None:
                 original_canon = original.copy()
                 original_canon.canonicalize()
 
+                mutants = []
                 for _ in range(MUTANTS_PER_WORD):
                     # Create a mutant
                     mutant = original.copy()
@@ -87,10 +61,23 @@ def fuzz_word_canonicalization(seed: int, thread_id: int) -> None:
                         LAYER_MUTATIONS_PER_LAYER,
                         BRAID_MUTATIONS_PER_BRAID,
                     )
+                    mutants.append(mutant)
+                    tests += 1
+
+                    if tests % UPDATE_FREQ == 0:
+                        with open(TEST_OUT_INFO, "a+", encoding="utf-8") as f:
+                            seed += THREADS
+                            rng = random.Random(seed)
+                            f.write(
+                                f"Process {thread_id}: tested {tests} words so far, seed {seed}\n"
+                            )
+
+                # Canonicalize every mutant in one batch
+                mutant_canons = [mutant.copy() for mutant in mutants]
+                Word.canonicalize_many(mutant_canons)
 
-                    # Chech canon forms are equal
-                    mutant_canon = mutant.copy()
-                    mutant_canon.canonicalize()
+                # Chech canon forms are equal
+                for mutant, mutant_canon in zip(mutants, mutant_canons):
                     if original_canon != mutant_canon:
                         with open(TEST_ERROR_INFO, "a+", encoding="utf-8") as f:
                             f.write(repr(original))
@@ -108,15 +95,6 @@ def fuzz_word_canonicalization(seed: int, thread_id: int) -> None:
                         assert (
                             original_canon == mutant_canon
                         ), f"Process {thread_id}: mismatch: {original_canon}, {mutant_canon}"
-                    tests += 1
-
-                    if tests % UPDATE_FREQ == 0:
-                        with open(TEST_OUT_INFO, "a+", encoding="utf-8") as f:
-                            seed += THREADS
-                            rng = random.Random(seed)
-                            f.write(
-                                f"Process {thread_id}: tested {tests} words so far, seed {seed}\n"
-                            )
 
 
 def test_word_canonicalization_fuzzing_multithreaded() -> None:
@@ -144,6 +122,253 @@ def test_word_canonicalization_fuzzing_singlethreaded() -> None:
     fuzz_word_canonicalization(BASE_SEED - 1, -1)
 
 
+def test_incremental_canonicalization() -> None:
+    """Re-canonicalizing after a local edit only redoes the
+    word below the edit and still reaches the canonical form"""
+    rng = random.Random(BASE_SEED)
+    for num_boxes in range(MIN_BOXES, MAX_BOXES + 1):
+        canon = random_word(num_boxes, rng)
+        canon.canonicalize()
+        assert canon.is_canonical()
+        for index in range(num_boxes + 1):
+            edited = canon.copy()
+            edited.fuzz_braid(index, rng.random, BRAID_MUTATIONS_PER_BRAID)
+            if index < num_boxes:
+                edited.fuzz_layer(index, rng.random, LAYER_MUTATIONS_PER_LAYER)
+            assert not edited.is_canonical()
+            edited.canonicalize()
+            assert edited.is_canonical()
+            assert edited == canon, f"mismatch after editing index {index}"
+
+
+def test_stream_canonicalization() -> None:
+    """Canonicalizing a word as a top-down stream gives
+    the same braids and layers as Word.canonicalize"""
+    rng = random.Random(BASE_SEED + 1)
+    for num_boxes in range(MIN_BOXES, MAX_BOXES + 1):
+        for _ in range(WORDS_PER_NUM_BOXES * 5):
+            w = random_word(num_boxes, rng)
+            canon = w.copy()
+            canon.canonicalize()
+            streamed = list(canonicalize_stream(reversed(list(w.copy()))))
+            assert streamed == list(reversed(list(canon)))
+
+
+def test_copy_on_write() -> None:
+    """Changing a copy, or the word it was copied from,
+    never changes the other"""
+    seed = BASE_SEED + 3
+    for num_boxes in range(MIN_BOXES, MAX_BOXES + 1):
+        rng = random.Random(seed + num_boxes)
+        # random_word draws its braids from the global generator
+        random.seed(seed)
+        original = random_word(num_boxes, random.Random(seed))
+        random.seed(seed)
+        untouched = random_word(num_boxes, random.Random(seed))
+        for index in range(num_boxes):
+            mutant = original.copy()
+            mutant.fuzz_layer(index, rng.random, LAYER_MUTATIONS_PER_LAYER)
+            mutant.fuzz_braid(index + 1, rng.random, BRAID_MUTATIONS_PER_BRAID)
+            assert original == untouched
+            mutant.canonicalize()
+            assert original == untouched
+        canon = original.copy()
+        original.fuzz(rng.random, LAYER_MUTATIONS_PER_LAYER, BRAID_MUTATIONS_PER_BRAID)
+        untouched.canonicalize()
+        assert canon != untouched
+        canon.canonicalize()
+        assert canon == untouched
+
+
+
+
+def check_connections(word: Word) -> None:
+    """Asserts that the layers and strand positions the word
+    finds for each object match where the object is
+
+    Args:
+        word (Word): Word to check
+    """
+    # the objects at the bottom of each braid
+    below: list[list[PrimitiveObject]] = []
+    context: Sequence[PrimitiveObject] = []
+    for part in word:
+        if isinstance(part, Braid):
+            below.append(list(context))
+        context = part.context_out(context)
+    for i, part in enumerate(word):
+        if not isinstance(part, Layer):
+            continue
+        for o in part.middle().outs():
+            assert word.made_by(o) == i // 2
+        for o in part.middle().ins():
+            assert word.used_by(o) == i // 2
+            assert word.layers_touching(o)[-1] == i // 2
+        for o in part.middle().ins() + part.middle().outs():
+            positions = word.strand_positions(o)
+            assert positions
+            for braid, position in positions:
+                assert below[braid][position] is o
+
+
+def test_connections() -> None:
+    """Objects are found where they are in the word after
+    fuzzing, copying, canonicalizing and swapping layers"""
+    rng = random.Random(BASE_SEED + 4)
+    for num_boxes in range(MIN_BOXES, MAX_BOXES + 2):
+        original = connected_word(num_boxes, rng)
+        w = original.copy()
+        w.fuzz(rng.random, LAYER_MUTATIONS_PER_LAYER, BRAID_MUTATIONS_PER_BRAID)
+        w.canonicalize()
+        check_connections(original)
+        check_connections(w)
+        for index in range(num_boxes - 1):
+            swapped = original.copy()
+            swapped.attempt_swap(index)
+            check_connections(swapped)
+        check_connections(original)
+
+
+def test_parallel_canonicalization() -> None:
+    """Canonicalizing words in a process pool gives the same
+    words as canonicalizing them one at a time"""
+    rng = random.Random(BASE_SEED + 5)
+    words = [connected_word(num_boxes, rng) for num_boxes in range(1, 6)]
+    words += [wide_word(3, num_boxes, rng) for num_boxes in range(3, 12, 4)]
+    serial = [w.copy() for w in words]
+    parallel = [w.copy() for w in words]
+    Word.canonicalize_many(serial)
+    Word.canonicalize_many(parallel, processes=2)
+    assert parallel == serial
+    assert all(w.is_canonical() for w in parallel)
+    for w in parallel:
+        check_connections(w)
+        w.fuzz(rng.random, LAYER_MUTATIONS_PER_LAYER, BRAID_MUTATIONS_PER_BRAID)
+        w.canonicalize()
+    assert parallel == serial
+
+
+def test_components_canonicalize_apart() -> None:
+    """Words side by side split into components, which
+    canonicalize in a process pool to the canonical form of
+    mutants that fuzzing has braided into one component"""
+    rng = random.Random(BASE_SEED + 6)
+    for num_boxes in range(3, 12, 2):
+        original = wide_word(3, num_boxes, rng)
+        components = original.components()
+        assert len(components) >= 2
+        assert sorted(i for c in components for i in c) == list(range(num_boxes))
+        mutant = original.copy()
+        mutant.fuzz(rng.random, LAYER_MUTATIONS_PER_LAYER, BRAID_MUTATIONS_PER_BRAID)
+        assert len(mutant.components()) < len(components)
+        mutant.canonicalize()
+        original.canonicalize(processes=2)
+        assert original == mutant
+        check_connections(original)
+
+
+def test_reorder() -> None:
+    """Words that differ by swapping layers get the same
+    order, and reordering twice makes no more swaps"""
+    rng = random.Random(BASE_SEED + 6)
+    for num_boxes in range(2, 12):
+        w = connected_word(num_boxes, rng, letters=0)
+        shuffled = w.copy()
+        for _ in range(num_boxes * num_boxes):
+            shuffled.attempt_swap(rng.randrange(num_boxes - 1))
+        w.reorder()
+        shuffled.reorder()
+        assert shuffled == w
+        assert w.reorder() == 0
+        check_connections(w)
+
+
+def test_transactions() -> None:
+    """Rolling back undoes layer operations, braid edits,
+    appends and swaps, leaving the word as it was"""
+    rng = random.Random(BASE_SEED + 7)
+    for num_boxes in range(MIN_BOXES, MAX_BOXES + 2):
+        w = connected_word(num_boxes, rng)
+        before = w.copy()
+        w.begin_transaction()
+        w.fuzz(rng.random, LAYER_MUTATIONS_PER_LAYER, BRAID_MUTATIONS_PER_BRAID)
+        for index in range(num_boxes - 1):
+            w.try_swap(index)
+        w.canonicalize()
+        strands = len(w.context_out([]))
+        w.append_braid(random_braid_word(strands, 5))
+        w.append_layer(Layer(0, Knit(Bed(True), Dir(True), [], [Loop(0)]), strands))
+        w.reorder()
+        assert w != before
+        with pytest.raises(TransactionException):
+            w.copy()
+        w.rollback()
+        assert w == before
+        assert not w.is_canonical()
+        check_connections(w)
+
+        flat = connected_word(num_boxes, rng, letters=0)
+        before = flat.copy()
+        swaps = 0
+        for _ in range(num_boxes * num_boxes):
+            index = rng.randrange(max(num_boxes - 1, 1))
+            probe = flat.copy()
+            if index + 1 < num_boxes and probe.attempt_swap(index):
+                swaps += 1
+                assert flat.try_swap(index)
+                before = flat.copy()
+            elif index + 1 < num_boxes:
+                assert not flat.try_swap(index)
+                assert flat == before
+        check_connections(flat)
+
+        # the top layer has nothing to swap with, which the
+        # swap finds out after changing the word
+        w = connected_word(num_boxes, rng)
+        before = w.copy()
+        with pytest.raises(IndexError):
+            w.try_swap(num_boxes - 1)
+        assert w == before
+        w.begin_transaction()
+        w.commit()
+
+
+def test_emit_templates() -> None:
+    """Canonicalizing the same word again reuses the cached
+    delta and underline emits and gives the same result"""
+    templates.clear()
+    w = random_word(MAX_BOXES, random.Random(BASE_SEED + 2))
+    first = w.copy()
+    first.canonicalize()
+    assert templates.hits() and not any(templates.hits().values())
+    second = w.copy()
+    second.canonicalize()
+    assert all(templates.hits().values())
+    assert first == second
+
+
+def test_emit_templates_widen() -> None:
+    """Boxes of the same shape share one cached emit whatever
+    is right of them, and the cache stays within its size"""
+
+    def box(right: int) -> Layer:
+        k = Knit(Bed(True), Dir(False), [Loop(0)], [Loop(0), Loop(0)])
+        return Layer(1, k, right)
+
+    templates.clear()
+    narrow = box(0).delta(Sign(True))
+    wide = box(3).delta(Sign(True))
+    assert list(templates.hits().values()) == [1]
+    assert (wide.below().n(), wide.above().n()) == (5, 6)
+    assert list(wide.above()) == list(narrow.above())
+    templates.resize(0)
+    assert len(templates) == 0
+    fresh = box(3).delta(Sign(True))
+    assert (fresh.below(), fresh.above()) == (wide.below(), wide.above())
+    assert len(templates) == 0
+    templates.resize(1024)
+
+
 # Run the multithreaded test
 if __name__ == "__main__":
     test_word_canonicalization_fuzzing_multithreaded()
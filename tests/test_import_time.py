@@ -0,0 +1,34 @@
+"""Tests that importing the word machinery stays
+cheap and doesn't load any canonicalization engine"""
+
+import os
+import subprocess
+import sys
+
+# microseconds, as reported by python -X importtime
+IMPORT_BUDGET = 500_000
+LAZY_MODULES = ("sage.all", "braid.sage", "braid.canon.garside", "concurrent.futures")
+
+
+def test_import_layer_word_budget() -> None:
+    """import layer.word stays under IMPORT_BUDGET and
+    leaves the engines unimported"""
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(sys.path))
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import layer.word"],
+        capture_output=True,
+        check=True,
+        env=env,
+        text=True,
+    )
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line.split("|")
+        if cumulative.strip().isdigit():
+            times[name.strip()] = int(cumulative)
+
+    assert times["layer.word"] < IMPORT_BUDGET, f"{times['layer.word']}us"
+    for module in LAZY_MODULES:
+        assert module not in times, f"import layer.word imported {module}"
@@ -1,11 +1,14 @@
 """Tests for layer
 canonicalization"""
 
+from typing import Optional
 from braid.braid import Braid
+from braid.braid_generator import BraidGenerator
 from category.morphism import Knit
-from category.object import Carrier, Loop
-from common.common import Bed, Dir
+from category.object import Carrier, Loop, PrimitiveObject
+from common.common import Bed, Dir, Sign
 from layer.layer import Layer
+from layer.layer_emit import LayerEmit
 from src.layer.word import Word
 
 l1 = Loop(0)
@@ -67,3 +70,57 @@ def test_basic_example() -> None:
     # can_word.compile_latex("canword_canon", [])
 
     assert word == canon_word
+
+
+def test_delta_power() -> None:
+    """A delta power does the same as that many deltas"""
+    for k in range(-4, 5):
+        loops = [Loop(0), Loop(0), Carrier(0)]
+        one_by_one = Layer(1, Knit(Bed(True), Dir(False), [Loop(0)], loops), 1)
+        at_once = one_by_one.copy({})
+        emit = one_by_one.identity_emit()
+        for _ in range(abs(k)):
+            emit.extend(one_by_one.delta(Sign(k > 0)))
+        power = at_once.delta_power(k)
+        assert power.above() == emit.above() and power.below() == emit.below()
+        assert at_once == one_by_one
+        assert [o.twists() for o in at_once.middle().outs()] == [
+            o.twists() for o in one_by_one.middle().outs()
+        ]
+
+
+def test_emit_log() -> None:
+    """Logged emits read back the same braids as emitting
+    generator by generator, through flips and extends"""
+    first = LayerEmit(3, 4)
+    for c in "abA":
+        first.emit_below(BraidGenerator.from_char(c))
+    for c in "cB":
+        first.emit_above(BraidGenerator.from_char(c))
+    assert str(first.below()) == "abA" and str(first.above()) == "Bc"
+
+    flipped = first.flip_vertical()
+    assert str(flipped.below()) == "cB" and str(flipped.above()) == "Aba"
+    flipped.emit_below(BraidGenerator.from_char("a"))
+    flipped.emit_above(BraidGenerator.from_char("b"))
+    flipped.extend(first.flip_vertical())
+    assert str(flipped.below()) == "cBacB" and str(flipped.above()) == "Abab" + "Aba"
+    assert flipped.flip_vertical().flip_vertical().below() == flipped.below()
+
+    first.extend(first.copy())
+    assert str(first.below()) == "abAabA" and str(first.above()) == "BcBc"
+
+
+def test_knit_owns_its_lists() -> None:
+    """Changing the lists a knit was made from doesn't
+    change the knit or its cached objects"""
+    ins: list[Optional[PrimitiveObject]] = [Loop(0)]
+    outs: list[Optional[PrimitiveObject]] = [Loop(0), Loop(0)]
+    k = Knit(Bed(True), Dir(False), list(ins), list(outs))
+    kept = Knit(Bed(True), Dir(False), ins, outs)
+    ins.append(Loop(0))
+    outs.reverse()
+    assert kept.true_ins() == tuple(kept.ins()) and kept.n_ins() == 1
+    assert kept.true_outs() == tuple(outs[::-1])
+    assert kept.primary() is kept.true_outs()[kept.primary_index()]
+    assert kept == k